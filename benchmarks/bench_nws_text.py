@@ -0,0 +1,203 @@
+"""Time NWS text product extraction on the archived-style samples in benchmarks/data.
+
+Runs the AFD key-message, HWO section, SPC mesoscale discussion and alert
+bullet extractors against the per-lookup regex searches they replaced,
+checks that both produce the same output, and confirms that a lower-case
+".then..." prose line is not tokenized as a section heading. The HWO and AFD
+samples are also run through check_forecast_products, with the product
+fetches served from the samples and posts captured instead of sent.
+
+    python benchmarks/bench_nws_text.py [--repeat 2000]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("MASTODON_API_BASE_URL", "https://mastodon.invalid")
+os.environ.setdefault("WEATHERBOT_LOG_FILE", os.devnull)
+os.environ.setdefault("WEATHERBOT_STATE_DB", os.path.join(tempfile.mkdtemp(), "bench_state.sqlite3"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main as weatherbot  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+HWO_HEADINGS = ("DAY ONE", "DAYS TWO THROUGH SEVEN", "SPOTTER INFORMATION STATEMENT")
+SPC_LABELS = ("Concerning", "Probability of Watch Issuance", "SUMMARY")
+ALERT_LABELS = ("WHAT", "WHERE", "WHEN")
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as handle:
+        return handle.read()
+
+
+# The regex searches used before products were tokenized, one scan per lookup.
+def legacy_afd(text: str) -> list:
+    match = re.search(
+        r"\.KEY MESSAGES\.\.\.(.*?)(?:\n&&|\n\.[A-Z][A-Z0-9 /]+\.\.\.)",
+        text,
+        re.IGNORECASE | re.DOTALL,
+    )
+    if not match:
+        return []
+    messages = []
+    current = []
+    for raw_line in match.group(1).splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        if line.startswith("-"):
+            if current:
+                messages.append(weatherbot._collapse_whitespace(" ".join(current)))
+            current = [line.lstrip("- ").strip()]
+        elif current:
+            current.append(line)
+    if current:
+        messages.append(weatherbot._collapse_whitespace(" ".join(current)))
+    return [message for message in messages if message][:4]
+
+
+def legacy_hwo(text: str) -> list:
+    segment = next(
+        (part for part in re.split(r"\n\$\$\s*\n", text) if re.search(r"\bPeoria\b", part, re.IGNORECASE)),
+        None,
+    )
+    sections = []
+    for heading in HWO_HEADINGS:
+        pattern = rf"\.{re.escape(heading)}\.\.\.(.*?)(?=\n\.[A-Z ]+\.\.\.|\n&&|\n\$\$|\Z)"
+        match = re.search(pattern, segment or "", re.IGNORECASE | re.DOTALL)
+        if not match:
+            sections.append(None)
+            continue
+        lines = []
+        result = None
+        for raw_line in match.group(1).splitlines():
+            line = raw_line.strip()
+            if not line or line.lower().rstrip(".") in weatherbot.HWO_TIMEFRAME_LINES:
+                continue
+            if "spotter activation" in line.lower() and "not anticipated" in line.lower():
+                result = "not anticipated through tonight"
+                break
+            if weatherbot._HWO_ZONE_LINE.match(line):
+                continue
+            lines.append(line)
+        sections.append(result or weatherbot._collapse_whitespace(" ".join(lines)) or None)
+    return sections
+
+
+def legacy_spc_md(text: str) -> list:
+    lines = []
+    for label in SPC_LABELS:
+        pattern = rf"{re.escape(label)}\.\.\.(.*?)(?=\n[A-Z][A-Za-z /]+\.\.\.|\n\n|\Z)"
+        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        lines.append(weatherbot._shorten_sentence(match.group(1), 145) if match else None)
+    return lines
+
+
+def legacy_alert(text: str) -> list:
+    values = []
+    for label in ALERT_LABELS:
+        marker = f"* {label}..."
+        collecting = False
+        collected = []
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if line.startswith("* ") and "..." in line:
+                if collecting:
+                    break
+                if line.upper().startswith(marker):
+                    collecting = True
+                    collected.append(line.split("...", 1)[1])
+                continue
+            if collecting:
+                collected.append(line)
+        values.append(weatherbot._collapse_whitespace(" ".join(collected)))
+    return values
+
+
+def tokenized_afd(text: str) -> list:
+    return weatherbot._extract_afd_key_messages(text)
+
+
+def tokenized_hwo(text: str) -> list:
+    segment = weatherbot._peoria_hwo_segment(text)
+    return [weatherbot._extract_hwo_section(segment, heading) for heading in HWO_HEADINGS]
+
+
+def tokenized_spc_md(text: str) -> list:
+    product = weatherbot.NWSTextProduct(text, labels=True)
+    return [weatherbot._extract_spc_line(product, label) for label in SPC_LABELS]
+
+
+def tokenized_alert(text: str) -> list:
+    product = weatherbot.NWSTextProduct(text)
+    return [weatherbot._extract_nws_bullet(product, label) for label in ALERT_LABELS]
+
+
+CASES = (
+    ("ilx_afd.sample.txt", legacy_afd, tokenized_afd),
+    ("ilx_hwo.sample.txt", legacy_hwo, tokenized_hwo),
+    ("spc_md.sample.txt", legacy_spc_md, tokenized_spc_md),
+    ("ilx_svr_alert.sample.txt", legacy_alert, tokenized_alert),
+)
+
+
+def check_products_end_to_end():
+    """Run check_forecast_products on the HWO and AFD samples; both must be posted."""
+    products = {
+        weatherbot.NWS_HWO_URL: {"id": "sample-hwo", "productText": _read("ilx_hwo.sample.txt")},
+        weatherbot.NWS_AFD_URL: {"id": "sample-afd", "productText": _read("ilx_afd.sample.txt")},
+    }
+    posted = []
+    weatherbot._fetch_latest_nws_product = lambda url, name, conditional=False: products.get(url)
+    weatherbot.fetch_spc_md_items = lambda conditional=False: []
+    weatherbot._fetch_recent_nws_products = lambda *args, **kwargs: []
+    weatherbot.enqueue_post = lambda message, **kwargs: posted.append(kwargs.get("label")) or True
+
+    weatherbot.check_forecast_products(force=True)
+    if posted != ["NWS HWO", "NWS AFD"]:
+        raise SystemExit(f"check_forecast_products posted {posted!r}, expected the HWO and AFD samples")
+    for key in ("HWO|sample-hwo", "AFD|sample-afd"):
+        if key not in weatherbot._forecast_product_history:
+            raise SystemExit(f"check_forecast_products did not record {key}")
+
+
+def _time_us(function, text: str, repeat: int) -> list:
+    samples = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            function(text)
+        samples.append((time.perf_counter() - started) / repeat * 1e6)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    afd = _read("ilx_afd.sample.txt")
+    short_term = weatherbot.NWSTextProduct(afd).block("sections", "SHORT TERM")
+    if not short_term or not any(line.startswith(".then...the line") for line in short_term):
+        raise SystemExit("a lower-case '.then...' line was tokenized as a section heading")
+    check_products_end_to_end()
+
+    print(f"median of 5 runs x {args.repeat} calls, microseconds per product")
+    for name, legacy, tokenized in CASES:
+        text = _read(name)
+        expected = legacy(text)
+        if tokenized(text) != expected:
+            raise SystemExit(f"{name}: tokenized output {tokenized(text)!r} != legacy {expected!r}")
+        legacy_us = statistics.median(_time_us(legacy, text, args.repeat))
+        tokenized_us = statistics.median(_time_us(tokenized, text, args.repeat))
+        print(f"  {name:<26} {len(text):>6} bytes  legacy {legacy_us:8.1f}  tokenized {tokenized_us:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
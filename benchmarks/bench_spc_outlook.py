@@ -0,0 +1,116 @@
+"""Time SPC outlook point matching on the sample GeoJSON in benchmarks/data.
+
+Compares the original per-point ray cast over raw coordinates with the
+prepared-geometry path (bounding boxes, NumPy when installed) and with the
+streaming parse, and checks that all three find the same features at every
+SPC_LOCAL_POINTS location.
+
+    python benchmarks/bench_spc_outlook.py [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("MASTODON_API_BASE_URL", "https://mastodon.invalid")
+os.environ.setdefault("WEATHERBOT_LOG_FILE", os.devnull)
+os.environ.setdefault("WEATHERBOT_STATE_DB", os.path.join(tempfile.mkdtemp(), "bench_state.sqlite3"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main as weatherbot  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SAMPLES = ("day1otlk_cat.sample.geojson", "day1otlk_torn.sample.geojson")
+
+
+def _legacy_point_in_ring(lon, lat, ring):
+    inside = False
+    j = len(ring) - 1
+    for i, point in enumerate(ring):
+        xi, yi = float(point[0]), float(point[1])
+        xj, yj = float(ring[j][0]), float(ring[j][1])
+        if ((yi > lat) != (yj > lat)) and lon < (xj - xi) * (lat - yi) / ((yj - yi) or 1e-12) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _legacy_point_in_geometry(lon, lat, geometry):
+    polygons = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+    return any(
+        _legacy_point_in_ring(lon, lat, polygon[0])
+        and not any(_legacy_point_in_ring(lon, lat, hole) for hole in polygon[1:])
+        for polygon in polygons
+    )
+
+
+def legacy(body: bytes, points: tuple) -> list:
+    features = json.loads(body)["features"]
+    return [
+        [feature["properties"] for feature in features if _legacy_point_in_geometry(lon, lat, feature["geometry"])]
+        for lon, lat in points
+    ]
+
+
+def prepared(body: bytes, points: tuple) -> list:
+    return weatherbot._spc_features_at_points(weatherbot._prepare_spc_features(json.loads(body)), list(points))
+
+
+class _ChunkedResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def streamed(body: bytes, points: tuple) -> list:
+    matches = [[] for _ in points]
+    for feature in weatherbot._iter_geojson_features(_ChunkedResponse(body)):
+        found = weatherbot._spc_features_at_points(weatherbot._prepare_spc_features({"features": [feature]}), list(points))
+        for index, properties in enumerate(found):
+            matches[index].extend(properties)
+    return matches
+
+
+def _labels(matches: list) -> list:
+    return [sorted(properties["LABEL"] for properties in point_matches) for point_matches in matches]
+
+
+def _time(function, body: bytes, points: tuple, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(body, points)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    points = weatherbot._spc_point_coordinates(weatherbot.SPC_LOCAL_POINTS)
+    print(f"numpy: {'yes' if weatherbot.np is not None else 'no'}, {len(points)} points, best/median of {args.repeat}")
+    for name in SAMPLES:
+        with open(os.path.join(DATA_DIR, name), "rb") as handle:
+            body = handle.read()
+        expected = _labels(legacy(body, points))
+        for variant in (prepared, streamed):
+            if _labels(variant(body, points)) != expected:
+                raise SystemExit(f"{name}: {variant.__name__} disagrees with the legacy ray cast")
+
+        print(f"{name} ({len(body) / 1024:.0f} KiB), matches at Peoria: {expected[0]}")
+        for variant in (legacy, prepared, streamed):
+            samples = _time(variant, body, points, args.repeat)
+            print(f"  {variant.__name__:<9} {min(samples):8.2f} ms {statistics.median(samples):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Check TTLIndex expiry against a brute-force filter and time it at two history sizes.
+
+Loads N keys with epochs spread over the retention window (plus some already
+stale), re-stamps a share of them as updates, then advances the clock one
+check interval at a time. After every expire() pass the expired keys and the
+keys still held must match a brute-force filter over a plain dict. Timings
+compare expire() with the full scan it replaced.
+
+    python benchmarks/bench_ttl_index.py [--sizes 100000 1000000] [--steps 50]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("MASTODON_API_BASE_URL", "https://mastodon.invalid")
+os.environ.setdefault("WEATHERBOT_LOG_FILE", os.devnull)
+os.environ.setdefault("WEATHERBOT_STATE_DB", os.path.join(tempfile.mkdtemp(), "bench_state.sqlite3"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main as weatherbot  # noqa: E402
+
+RETENTION_SECONDS = 7 * 24 * 3600
+CHECK_INTERVAL_SECONDS = 60
+
+
+def run(size: int, steps: int, rng: random.Random) -> dict:
+    now = 1_800_000_000.0
+    index = weatherbot.TTLIndex()
+    reference = {}
+    for number in range(size):
+        key = f"key-{number}"
+        epoch = now - rng.uniform(-3600, RETENTION_SECONDS + 6 * 3600)
+        index.add(key, epoch)
+        reference[key] = epoch
+    # Updates move a key to a newer bucket, leaving its old slot behind.
+    for key in rng.sample(sorted(reference), size // 10):
+        epoch = now - rng.uniform(0, 3600)
+        index.add(key, epoch)
+        reference[key] = epoch
+
+    bucketed_ms = []
+    scan_ms = []
+    expired_total = 0
+    for step in range(steps):
+        now += CHECK_INTERVAL_SECONDS
+        for number in range(20):
+            key = f"new-{step}-{number}"
+            index.add(key, now)
+            reference[key] = now
+        cutoff = now - RETENTION_SECONDS
+
+        started = time.perf_counter()
+        stale = [key for key, epoch in reference.items() if epoch < cutoff]
+        scan_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        expired = index.expire(cutoff)
+        bucketed_ms.append((time.perf_counter() - started) * 1000)
+
+        if sorted(expired) != sorted(stale):
+            raise SystemExit(f"size {size}, step {step}: expire() disagrees with the brute-force filter")
+        for key in stale:
+            del reference[key]
+        if len(index) != len(reference):
+            raise SystemExit(f"size {size}, step {step}: index holds {len(index)} keys, expected {len(reference)}")
+        expired_total += len(expired)
+
+    for key in rng.sample(sorted(reference), min(1000, len(reference))):
+        if index.epoch(key) != reference[key]:
+            raise SystemExit(f"size {size}: epoch for {key} drifted")
+    return {"expired": expired_total, "bucketed_ms": bucketed_ms, "scan_ms": scan_ms}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=17)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        result = run(size, args.steps, random.Random(args.seed))
+        print(
+            f"{size:>9} keys: matched brute force over {args.steps} passes ({result['expired']} expired); "
+            f"expire() median {statistics.median(result['bucketed_ms']):.3f} ms, "
+            f"full scan median {statistics.median(result['scan_ms']):.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Regenerate the sample SPC outlook GeoJSON files used by bench_spc_outlook.py.
+
+The files mimic the day 1 categorical and tornado ``.nolyr.geojson`` layers on
+an active severe day: several MultiPolygon features of a few thousand vertices
+each, coordinates to two decimals, and SPC's property names. The output is
+deterministic, so the committed files can be rebuilt byte for byte:
+
+    python benchmarks/make_spc_samples.py
+"""
+
+import json
+import math
+import os
+import random
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+ISSUE = {"VALID": "202604271300", "EXPIRE": "202604281200", "ISSUE": "202604271243"}
+ISO = {
+    "VALID_ISO": "2026-04-27T13:00:00+00:00",
+    "EXPIRE_ISO": "2026-04-28T12:00:00+00:00",
+    "ISSUE_ISO": "2026-04-27T12:43:00+00:00",
+}
+
+
+def _blob(rng: random.Random, lon: float, lat: float, radius: float, vertices: int) -> list:
+    """A closed, irregular ring around (lon, lat), like a hand-drawn outlook line."""
+    phases = [rng.uniform(0, 2 * math.pi) for _ in range(4)]
+    ring = []
+    for index in range(vertices):
+        angle = 2 * math.pi * index / vertices
+        wobble = sum(math.sin((k + 2) * angle + phase) / (k + 3) for k, phase in enumerate(phases))
+        r = radius * (1 + 0.35 * wobble + rng.uniform(-0.01, 0.01))
+        ring.append([round(lon + 1.3 * r * math.cos(angle), 2), round(lat + r * math.sin(angle), 2)])
+    ring.append(ring[0])
+    return ring
+
+
+def _feature(dn: int, label: str, label2: str, polygons: list, stroke: str, fill: str) -> dict:
+    return {
+        "type": "Feature",
+        "geometry": {"type": "MultiPolygon", "coordinates": polygons},
+        "properties": {
+            "DN": dn,
+            **ISSUE,
+            **ISO,
+            "FORECASTER": "Sample",
+            "LABEL": label,
+            "LABEL2": label2,
+            "stroke": stroke,
+            "fill": fill,
+        },
+    }
+
+
+def categorical(rng: random.Random) -> dict:
+    # Outlines nest around central Illinois so the local points land in several risks.
+    center_lon, center_lat = -89.8, 40.6
+    tstm = [
+        [_blob(rng, center_lon, center_lat, 9.0, 5200), _blob(rng, -95.5, 37.5, 1.2, 400)],
+        [_blob(rng, -117.0, 36.0, 3.0, 1800)],
+        [_blob(rng, -81.0, 28.0, 2.0, 1200)],
+    ]
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            _feature(2, "TSTM", "General Thunderstorms Risk", tstm, "#55BB55", "#C1E9C1"),
+            _feature(3, "MRGL", "Marginal Risk", [[_blob(rng, center_lon, center_lat, 5.5, 3800)]], "#005500", "#66A366"),
+            _feature(4, "SLGT", "Slight Risk", [[_blob(rng, center_lon + 0.8, center_lat, 3.6, 3000)]], "#DDAA00", "#FFE066"),
+            _feature(5, "ENH", "Enhanced Risk", [[_blob(rng, center_lon + 1.1, center_lat - 0.2, 1.6, 2200)]], "#FF6600", "#FFA366"),
+            _feature(6, "MDT", "Moderate Risk", [[_blob(rng, -88.6, 39.9, 0.7, 1200)]], "#CD0000", "#E67F7F"),
+        ],
+    }
+
+
+def tornado(rng: random.Random) -> dict:
+    center_lon, center_lat = -89.4, 40.4
+    features = []
+    for dn, label, radius, vertices in ((2, "0.02", 6.0, 3600), (5, "0.05", 3.8, 2800), (10, "0.10", 2.2, 2000)):
+        features.append(_feature(
+            dn,
+            label,
+            f"{int(float(label) * 100)}% Tornado Risk",
+            [[_blob(rng, center_lon, center_lat, radius, vertices)]],
+            "#000000",
+            "#FFFFFF",
+        ))
+    sig = _blob(rng, center_lon + 0.5, center_lat, 1.5, 1400)
+    features.append(_feature(10, "SIGN", "Significant Tornado Risk", [[sig]], "#000000", "#888888"))
+    return {"type": "FeatureCollection", "features": features}
+
+
+def main():
+    os.makedirs(DATA_DIR, exist_ok=True)
+    for name, build, seed in (
+        ("day1otlk_cat.sample.geojson", categorical, 11),
+        ("day1otlk_torn.sample.geojson", tornado, 12),
+    ):
+        path = os.path.join(DATA_DIR, name)
+        with open(path, "w") as handle:
+            json.dump(build(random.Random(seed)), handle, separators=(",", ":"))
+        print(f"{path}: {os.path.getsize(path) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
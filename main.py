@@ -14,6 +14,8 @@
 
 import tweepy
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mastodon import Mastodon
 from bsky_bridge import BskySession, post_image, post_text
 import logging
@@ -24,7 +26,13 @@ import sys
 import time
 import math
 import html
-from datetime import datetime, timedelta
+import hashlib
+import mmap
+import struct
+from array import array
+import sqlite3
+import codecs
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 import xml.etree.ElementTree as ET
 from astral import LocationInfo
@@ -32,6 +40,19 @@ from astral.sun import sun
 from telegram import Bot  # Import for Telegram Bot API
 import asyncio  # For asynchronous operations
 import signal  # To handle signals (force update)
+import select
+import threading
+import queue
+import itertools
+import heapq
+import socket
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+try:
+    import numpy as np  # Optional: vectorized point-in-polygon tests
+except ImportError:
+    np = None
 # Load environment variables from a .env file
 from dotenv import load_dotenv
 load_dotenv()
@@ -69,48 +90,477 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
+# Shared HTTP client: one keep-alive pool per upstream host, with per-source timeout/retry policy.
+HTTP_USER_AGENT = "PeoriaWeatherBot/1.0"
+HTTP_POOL_MAXSIZE = 4
+HTTP_RETRY_BACKOFF_SECONDS = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_SOURCE_POLICIES = {
+    "nws": {"prefix": "https://api.weather.gov/", "timeout": 15, "retries": 2},
+    "spc": {"prefix": "https://www.spc.noaa.gov/", "timeout": 20, "retries": 2},
+    "usgs": {"prefix": "https://earthquake.usgs.gov/", "timeout": 15, "retries": 2},
+    "nwps": {"prefix": "https://api.water.noaa.gov/", "timeout": 15, "retries": 2},
+    "weatherflow": {"prefix": "https://swd.weatherflow.com/", "timeout": 15, "retries": 1},
+    # Catch-all for the heartbeat URL and anything else not matched above.
+    "heartbeat": {"prefix": "https://", "timeout": 10, "retries": 0},
+}
+HTTP_VALIDATOR_CACHE_FILE = "http_validator_cache.json"
+_http_request_counts = {}
+_http_validators = None
+# Validators from the latest 2xx conditional response per URL, saved only once
+# the caller has handled that body (see _commit_http_validators).
+_pending_http_validators = {}
+_http_validator_stats = {}
+_http_validator_lock = threading.Lock()
+
+
+class HTTPNotModified(Exception):
+    """Raised by a conditional _http_get when upstream answers 304 Not Modified."""
+
+
+def _build_http_session() -> requests.Session:
+    http_session = requests.Session()
+    http_session.headers["User-Agent"] = HTTP_USER_AGENT
+    for policy in HTTP_SOURCE_POLICIES.values():
+        retry = Retry(
+            total=policy["retries"],
+            backoff_factor=HTTP_RETRY_BACKOFF_SECONDS,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+        http_session.mount(policy["prefix"], adapter)
+    return http_session
+
+
+_http_session = _build_http_session()
+
+
+def _load_http_validators() -> dict:
+    global _http_validators
+    if _http_validators is not None:
+        return _http_validators
+
+    _http_validators = {}
+    if os.path.exists(HTTP_VALIDATOR_CACHE_FILE):
+        try:
+            with open(HTTP_VALIDATOR_CACHE_FILE, "r") as file:
+                _http_validators = json.load(file)
+        except Exception as e:
+            logging.error(f"Error loading HTTP validator cache: {e}")
+    return _http_validators
+
+
+def _save_http_validators():
+    try:
+        with open(HTTP_VALIDATOR_CACHE_FILE, "w") as file:
+            json.dump(_http_validators or {}, file)
+    except Exception as e:
+        logging.error(f"Error saving HTTP validator cache: {e}")
+
+
+def _record_validator_result(source: str, outcome: str):
+    with _http_validator_lock:
+        source_stats = _http_validator_stats.setdefault(source, {"hits": 0, "misses": 0})
+        source_stats[outcome] += 1
+
+
+def _http_get(source: str, url: str, conditional: bool = False, **kwargs) -> requests.Response:
+    """GET through the shared session.
+
+    With conditional=True the request carries the stored ETag/Last-Modified
+    validators for the URL and raises HTTPNotModified on a 304 so callers can
+    skip parsing and dedupe work entirely. The validators of a new response
+    are only held as pending; the caller saves them with
+    _commit_http_validators() after it has processed the body.
+    """
+    policy = HTTP_SOURCE_POLICIES.get(source, HTTP_SOURCE_POLICIES["heartbeat"])
+    kwargs.setdefault("timeout", policy["timeout"])
+    _http_request_counts[source] = _http_request_counts.get(source, 0) + 1
+    if not conditional:
+        return _http_session.get(url, **kwargs)
+
+    with _http_validator_lock:
+        validators = _load_http_validators()
+        cached = dict(validators.get(url) or {})
+        _pending_http_validators.pop(url, None)
+    headers = dict(kwargs.pop("headers", None) or {})
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = _http_session.get(url, headers=headers, **kwargs)
+    if response.status_code == 304:
+        _record_validator_result(source, "hits")
+        # Release the pooled connection; a streamed 304 is never read or closed by the caller.
+        response.close()
+        raise HTTPNotModified(url)
+
+    _record_validator_result(source, "misses")
+    if response.ok:
+        with _http_validator_lock:
+            _pending_http_validators[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+    return response
+
+
+def _commit_http_validators(*urls: str):
+    """Save the pending validators for each URL once its body has been handled.
+
+    A body that failed to parse or process is never committed, so the next
+    check downloads it again instead of getting a 304 for content it never used.
+    """
+    with _http_validator_lock:
+        validators = _load_http_validators()
+        changed = False
+        for url in urls:
+            pending = _pending_http_validators.pop(url, None)
+            if pending is None:
+                continue
+            if pending["etag"] or pending["last_modified"]:
+                current = validators.get(url) or {}
+                if {key: current.get(key) for key in pending} != pending:
+                    validators[url] = {**pending, "updated": time.time()}
+                    changed = True
+            elif url in validators:
+                validators.pop(url)
+                changed = True
+        if changed:
+            _save_http_validators()
+
+
+def _discard_http_validators(url: str):
+    with _http_validator_lock:
+        _pending_http_validators.pop(url, None)
+
+
+def _http_pool_summary() -> str:
+    """Summarize connection reuse from the urllib3 pools behind the shared session."""
+    host_stats = {}
+    for adapter in _http_session.adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_made, connections_made = host_stats.get(pool.host, (0, 0))
+            host_stats[pool.host] = (
+                requests_made + pool.num_requests,
+                connections_made + pool.num_connections,
+            )
+
+    if not host_stats:
+        return "no connections yet"
+    return "; ".join(
+        f"{host} {requests_made} requests/{connections_made} connections "
+        f"({max(0, requests_made - connections_made)} reused)"
+        for host, (requests_made, connections_made) in sorted(host_stats.items())
+    )
+
+
+def _log_http_stats():
+    source_text = ", ".join(
+        f"{source}={count}" for source, count in sorted(_http_request_counts.items())
+    ) or "none"
+    with _http_validator_lock:
+        validator_stats = {source: dict(stats) for source, stats in _http_validator_stats.items()}
+    validator_text = ", ".join(
+        f"{source} {stats['hits']} hits/{stats['misses']} misses"
+        for source, stats in sorted(validator_stats.items())
+    ) or "no conditional requests yet"
+    logging.info("HTTP requests by source: %s. Pools: %s.", source_text, _http_pool_summary())
+    logging.info("HTTP validator cache: %s.", validator_text)
+    logging.info("Telegram sender: %s.", telegram_sender.summary())
+    with _nws_product_cache_stats_lock:
+        cache_stats = dict(_nws_product_cache_stats)
+    logging.info("NWS product cache: %s hits/%s misses.", cache_stats["hits"], cache_stats["misses"])
+    logging.info("SPC layer timings: %s.", _spc_timing_summary())
+    if weatherflow_stream is not None:
+        logging.info("WeatherFlow stream: %s.", weatherflow_stream.summary())
+
+
 # Telegram configuration using your bot info
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+TELEGRAM_QUEUE_MAXSIZE = 50
+TELEGRAM_SEND_TIMEOUT_SECONDS = 60
+
+
+class TelegramSendUnconfirmed(Exception):
+    """A send timed out after it had started; Telegram may or may not have delivered it."""
+
+
+class TelegramSender:
+    """Long-lived Telegram client.
+
+    Keeps one Bot (and its HTTP connection pool) on one event loop running in a
+    background thread for the life of the process. Sends go through a bounded
+    queue and callers block until their send completes.
+    """
+
+    def __init__(self, token: str | None, chat_id: str | None, queue_maxsize: int):
+        self.token = token
+        self.chat_id = chat_id
+        self.queue_maxsize = queue_maxsize
+        self.metrics = {
+            "sent": 0,
+            "failed": 0,
+            "rejected": 0,
+            "cancelled": 0,
+            "total_latency": 0.0,
+            "max_latency": 0.0,
+        }
+        self._metrics_lock = threading.Lock()
+        self._bot = None
+        self._loop = None
+        self._queue = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run_loop, name="telegram-sender", daemon=True)
+            self._thread.start()
+        self._ready.wait(timeout=10)
+
+    def _run_loop(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue(maxsize=self.queue_maxsize)
+        self._loop.create_task(self._drain_queue())
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _get_bot(self):
+        if self._bot is None:
+            bot = Bot(token=self.token)
+            await bot.initialize()
+            self._bot = bot
+        return self._bot
+
+    def _count(self, outcome: str, latency: float | None = None):
+        with self._metrics_lock:
+            self.metrics[outcome] += 1
+            if latency is not None:
+                self.metrics["total_latency"] += latency
+                self.metrics["max_latency"] = max(self.metrics["max_latency"], latency)
+
+    async def _drain_queue(self):
+        while True:
+            request, future, enqueued_at = await self._queue.get()
+            started = time.monotonic()
+            try:
+                # The caller gave up and cancelled while this waited in the queue.
+                if not future.set_running_or_notify_cancel():
+                    continue
+                bot = await self._get_bot()
+                await request(bot)
+            except Exception as e:
+                self._count("failed")
+                future.set_exception(e)
+            else:
+                latency = time.monotonic() - enqueued_at
+                self._count("sent", latency)
+                future.set_result({"latency": latency, "queue_wait": started - enqueued_at})
+            finally:
+                self._queue.task_done()
+
+    def _enqueue(self, request, future):
+        try:
+            self._queue.put_nowait((request, future, time.monotonic()))
+        except asyncio.QueueFull:
+            self._count("rejected")
+            future.set_exception(RuntimeError(f"outbound queue is full ({self.queue_maxsize} pending)"))
+
+    def send(self, request) -> dict:
+        """Queue request(bot) on the sender loop and wait for it; returns latency info.
+
+        On timeout a still-queued request is cancelled, so a retry cannot post
+        twice. If it had already started, TelegramSendUnconfirmed is raised.
+        """
+        self._ensure_started()
+        future = Future()
+        self._loop.call_soon_threadsafe(self._enqueue, request, future)
+        try:
+            return future.result(timeout=TELEGRAM_SEND_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            if future.cancel():
+                self._count("cancelled")
+                raise RuntimeError(f"send still queued after {TELEGRAM_SEND_TIMEOUT_SECONDS}s; cancelled")
+            raise TelegramSendUnconfirmed(f"send still running after {TELEGRAM_SEND_TIMEOUT_SECONDS}s") from None
+
+    def summary(self) -> str:
+        with self._metrics_lock:
+            metrics = dict(self.metrics)
+        sent = metrics["sent"]
+        average = metrics["total_latency"] / sent if sent else 0.0
+        return (
+            f"{sent} sent, {metrics['failed']} failed, {metrics['rejected']} rejected, "
+            f"{metrics['cancelled']} cancelled, avg {average:.2f}s, max {metrics['max_latency']:.2f}s"
+        )
 
 
-def send_telegram_message(message):
+telegram_sender = TelegramSender(TELEGRAM_TOKEN, TELEGRAM_CHAT_ID, TELEGRAM_QUEUE_MAXSIZE)
+
+
+def send_telegram_message(message) -> bool:
+    async def _send_message(bot):
+        await bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=message)
+
     try:
-        bot = Bot(token=TELEGRAM_TOKEN)
-        # Since send_message is asynchronous, we run it via asyncio.run
-        asyncio.run(bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=message))
-        logging.info("Telegram: Message sent.")
+        result = telegram_sender.send(_send_message)
+        logging.info(
+            "Telegram: Message sent in %.2fs (queued %.2fs).",
+            result["latency"],
+            result["queue_wait"],
+        )
+        return True
+    except TelegramSendUnconfirmed:
+        raise
     except Exception as e:
         logging.error(f"Telegram: Sending message failed. Error: {e}")
+        return False
+
+
+class TimeSeriesBuffer:
+    """Fixed-capacity ring of (epoch, value) samples in time order, backed by two float arrays.
+
+    Appends drop samples older than max_age_seconds (and the oldest sample once
+    full) without rebuilding anything; latest_at_or_before() is a binary search.
+    """
+
+    __slots__ = ("capacity", "max_age_seconds", "_times", "_values", "_start", "_size")
+
+    def __init__(self, capacity: int, max_age_seconds: float):
+        self.capacity = capacity
+        self.max_age_seconds = max_age_seconds
+        self._times = array("d", [0.0]) * capacity
+        self._values = array("d", [0.0]) * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _slot(self, index: int) -> int:
+        return (self._start + index) % self.capacity
+
+    def append(self, epoch: float, value: float):
+        if self._size and epoch < self._times[self._slot(self._size - 1)]:
+            return
+        if self._size == self.capacity:
+            self._start = self._slot(1)
+            self._size -= 1
+        slot = self._slot(self._size)
+        self._times[slot] = epoch
+        self._values[slot] = value
+        self._size += 1
+        while self._size and epoch - self._times[self._start] > self.max_age_seconds:
+            self._start = self._slot(1)
+            self._size -= 1
+
+    def latest_at_or_before(self, epoch: float) -> tuple | None:
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._times[self._slot(middle)] <= epoch:
+                low = middle + 1
+            else:
+                high = middle
+        if low == 0:
+            return None
+        slot = self._slot(low - 1)
+        return self._times[slot], self._values[slot]
+
 
+# WeatherFlow stations: WEATHERFLOW_STATION_IDS is a comma-separated list; the first station
+# is the primary one that drives posts. WEATHERFLOW_STATION_ID still works for a single station.
+WEATHERFLOW_STATION_IDS = [
+    station_id.strip()
+    for station_id in (os.getenv("WEATHERFLOW_STATION_IDS") or os.getenv("WEATHERFLOW_STATION_ID") or "").split(",")
+    if station_id.strip()
+]
+
+
+class StationState:
+    """Daily peaks, rain/lightning event tracking and rolling windows for one station."""
+
+    __slots__ = (
+        "station_id",
+        "daily_date",
+        "daily_max_wind_avg",
+        "daily_max_wind_gust",
+        "current_event_strike_total",
+        "last_strike_epoch",
+        "current_rain_event_total",
+        "rain_event_baseline",
+        "last_rain_epoch",
+        "daily_high_temp_f",
+        "daily_low_temp_f",
+        "daily_rain_total_in",
+        "temp_history",
+        "pressure_history",
+        "last_rapid_alert_epoch",
+        "latest_snapshot",
+        "snapshot_key",
+        "cached_obs",
+        "cached_obs_epoch",
+    )
 
-# Global variables to track daily maximum wind values and event info for lightning and rain
-daily_max_wind_avg = 0.0
-daily_max_wind_gust = 0.0
-daily_date = datetime.now().strftime("%Y-%m-%d")
-current_event_strike_total = 0
-last_strike_epoch_global = None
-current_rain_event_total = 0.0
-rain_event_baseline = None
-last_rain_epoch_global = None
-
-# Daily stats for end-of-day summary
-_daily_high_temp_f = None
-_daily_low_temp_f = None
-_daily_rain_total_in = 0.0
+    def __init__(self, station_id: str):
+        self.station_id = station_id
+        # Rolling windows, replayed from the observation log at startup
+        self.temp_history = TimeSeriesBuffer(capacity=1024, max_age_seconds=2 * 3600)  # (epoch, temp_f)
+        self.pressure_history = TimeSeriesBuffer(capacity=1024, max_age_seconds=6 * 3600)  # (epoch, inHg)
+        self.last_rapid_alert_epoch = 0
+        self.latest_snapshot = None
+        # Observation the latest snapshot was built from, and the last REST fetch
+        self.snapshot_key = None
+        self.cached_obs = None
+        self.cached_obs_epoch = 0.0
+        self.reset_daily(datetime.now().strftime("%Y-%m-%d"))
+
+    def reset_daily(self, date_text: str):
+        self.daily_date = date_text
+        self.daily_max_wind_avg = 0.0
+        self.daily_max_wind_gust = 0.0
+        # Lightning and rain events restart with the day
+        self.current_event_strike_total = 0
+        self.last_strike_epoch = None
+        self.current_rain_event_total = 0.0
+        self.rain_event_baseline = None
+        self.last_rain_epoch = None
+        # Daily stats for end-of-day summary
+        self.daily_high_temp_f = None
+        self.daily_low_temp_f = None
+        self.daily_rain_total_in = 0.0
+
+
+_station_states = {station_id: StationState(station_id) for station_id in WEATHERFLOW_STATION_IDS or [""]}
+PRIMARY_STATION_ID = next(iter(_station_states))
 _last_daily_summary_date = None
 
-# Rapid change alert tracking (in-memory)
-_temp_history = []  # list of (epoch, temp_f)
-_last_rapid_alert_epoch = 0
+
+def _station_state(station_id: str | None = None) -> StationState:
+    return _station_states.get(station_id) or _station_states[PRIMARY_STATION_ID]
 
 # NWS alert tracking
 NWS_ALERT_ZONE = "ILC143"
 NWS_POINT_LAT = 40.6936
 NWS_POINT_LON = -89.5890
+NWS_ALERT_CHECK_INTERVAL = 5 * 60
 NWS_FORECAST_CACHE_SECONDS = 60 * 60
 BLUESKY_CHAR_LIMIT = 300
 ALERT_HISTORY_FILE = "alert_history.json"
+ALERT_HISTORY_TTL_SECONDS = 86400
 _last_nws_alert_check_epoch = 0
 _nws_forecast_url = None
 _forecast_peek_cache = {
@@ -129,6 +579,26 @@ SPC_OUTLOOK_PRODUCTS = [
         "geojson_url": "https://www.spc.noaa.gov/products/outlook/day1otlk_cat.nolyr.geojson",
         "source_url": "https://www.spc.noaa.gov/products/outlook/day1otlk.html",
         "image_url": "https://www.spc.noaa.gov/partners/outlooks/state/images/IL_swody1.png",
+        "probabilistic_layers": [
+            {
+                "key": "day1_torn",
+                "label": "Day 1 tornado",
+                "name": "Tornado",
+                "geojson_url": "https://www.spc.noaa.gov/products/outlook/day1otlk_torn.nolyr.geojson",
+            },
+            {
+                "key": "day1_wind",
+                "label": "Day 1 wind",
+                "name": "Wind",
+                "geojson_url": "https://www.spc.noaa.gov/products/outlook/day1otlk_wind.nolyr.geojson",
+            },
+            {
+                "key": "day1_hail",
+                "label": "Day 1 hail",
+                "name": "Hail",
+                "geojson_url": "https://www.spc.noaa.gov/products/outlook/day1otlk_hail.nolyr.geojson",
+            },
+        ],
     },
     {
         "key": "day2",
@@ -136,6 +606,26 @@ SPC_OUTLOOK_PRODUCTS = [
         "geojson_url": "https://www.spc.noaa.gov/products/outlook/day2otlk_cat.nolyr.geojson",
         "source_url": "https://www.spc.noaa.gov/products/outlook/day2otlk.html",
         "image_url": "https://www.spc.noaa.gov/partners/outlooks/state/images/IL_swody2.png",
+        "probabilistic_layers": [
+            {
+                "key": "day2_torn",
+                "label": "Day 2 tornado",
+                "name": "Tornado",
+                "geojson_url": "https://www.spc.noaa.gov/products/outlook/day2otlk_torn.nolyr.geojson",
+            },
+            {
+                "key": "day2_wind",
+                "label": "Day 2 wind",
+                "name": "Wind",
+                "geojson_url": "https://www.spc.noaa.gov/products/outlook/day2otlk_wind.nolyr.geojson",
+            },
+            {
+                "key": "day2_hail",
+                "label": "Day 2 hail",
+                "name": "Hail",
+                "geojson_url": "https://www.spc.noaa.gov/products/outlook/day2otlk_hail.nolyr.geojson",
+            },
+        ],
     },
     {
         "key": "day3",
@@ -143,9 +633,37 @@ SPC_OUTLOOK_PRODUCTS = [
         "geojson_url": "https://www.spc.noaa.gov/products/outlook/day3otlk_cat.nolyr.geojson",
         "source_url": "https://www.spc.noaa.gov/products/outlook/day3otlk.html",
         "image_url": "https://www.spc.noaa.gov/partners/outlooks/state/images/IL_swody3.png",
+        "probabilistic_layers": [
+            {
+                "key": "day3_prob",
+                "label": "Day 3 severe",
+                "name": "Severe",
+                "geojson_url": "https://www.spc.noaa.gov/products/outlook/day3otlk_prob.nolyr.geojson",
+            },
+        ],
     },
 ]
+# Points evaluated against each outlook in one pass: Peoria plus the seat of each local LSR county.
+SPC_LOCAL_POINTS = (
+    {"name": "Peoria", "county": "Peoria", "lat": NWS_POINT_LAT, "lon": NWS_POINT_LON},
+    {"name": "Pekin", "county": "Tazewell", "lat": 40.5675, "lon": -89.6407},
+    {"name": "Eureka", "county": "Woodford", "lat": 40.7214, "lon": -89.2729},
+    {"name": "Lewistown", "county": "Fulton", "lat": 40.3931, "lon": -90.1543},
+    {"name": "Lacon", "county": "Marshall", "lat": 41.0248, "lon": -89.4112},
+    {"name": "Toulon", "county": "Stark", "lat": 41.0936, "lon": -89.8648},
+    {"name": "Galesburg", "county": "Knox", "lat": 40.9478, "lon": -90.3712},
+    {"name": "Havana", "county": "Mason", "lat": 40.3000, "lon": -90.0609},
+    {"name": "Bloomington", "county": "McLean", "lat": 40.4842, "lon": -88.9937},
+)
 OFFICIAL_IMAGE_CACHE_DIR = "/tmp/peoriaweatherbot-images"
+# Streaming mode decodes the outlook GeoJSON one feature at a time and keeps only match results.
+SPC_STREAMING_PARSE = os.getenv("WEATHERBOT_SPC_STREAMING_PARSE", "1").strip().lower() in {"1", "true", "yes"}
+SPC_STREAM_CHUNK_BYTES = 64 * 1024
+_GEOJSON_FEATURES_START = re.compile(r'"features"\s*:\s*\[')
+# Per GeoJSON URL: prepared geometry, or (streaming) match results for a point set; reused on 304.
+_spc_geojson_cache = {}
+_spc_geojson_cache_lock = threading.Lock()
+_spc_layer_timings = {}
 SPC_RISK_RANKS = {
     "TSTM": 1,
     "MRGL": 2,
@@ -166,6 +684,7 @@ _last_spc_check_epoch = 0
 
 # USGS earthquake tracking
 EARTHQUAKE_HISTORY_FILE = "earthquake_history.json"
+EARTHQUAKE_HISTORY_TTL_SECONDS = 7 * 86400
 EARTHQUAKE_CHECK_INTERVAL = 30 * 60
 EARTHQUAKE_LOOKBACK_HOURS = 24
 EARTHQUAKE_LOCAL_RADIUS_KM = 250
@@ -177,12 +696,23 @@ _last_earthquake_check_epoch = 0
 
 # NWS/SPC forecast office products
 FORECAST_PRODUCT_HISTORY_FILE = "forecast_product_history.json"
+FORECAST_PRODUCT_HISTORY_TTL_SECONDS = 7 * 86400
 FORECAST_PRODUCT_CHECK_INTERVAL = 30 * 60
 NWS_PRODUCT_OFFICE = "ILX"
 NWS_AFD_URL = f"https://api.weather.gov/products/types/AFD/locations/{NWS_PRODUCT_OFFICE}"
 NWS_HWO_URL = f"https://api.weather.gov/products/types/HWO/locations/{NWS_PRODUCT_OFFICE}"
 NWS_LSR_URL = f"https://api.weather.gov/products/types/LSR/locations/{NWS_PRODUCT_OFFICE}"
 SPC_RSS_URL = "https://www.spc.noaa.gov/products/spcrss.xml"
+NWS_PRODUCT_DETAIL_WORKERS = 4
+NWS_PRODUCT_CACHE_DIR = "nws_product_cache"
+NWS_PRODUCT_CACHE_MAX_BYTES = 25 * 1024 * 1024
+NWS_PRODUCT_CACHE_MAX_AGE_SECONDS = 7 * 86400
+_nws_product_cache_stats = {"hits": 0, "misses": 0}
+_nws_product_cache_stats_lock = threading.Lock()
+_nws_product_cache_lock = threading.Lock()
+# path -> (mtime, size), oldest first; scanned from disk once, then kept in step with stores
+_nws_product_cache_index = None
+_nws_product_cache_bytes = 0
 LSR_LOOKBACK_HOURS = 24
 LSR_LOCAL_COUNTIES = {
     "Peoria", "Tazewell", "Woodford", "Fulton", "Marshall",
@@ -215,12 +745,10 @@ SUNRISE_NOTICE_MINUTES = _env_int("SUNRISE_NOTICE_MINUTES", 60)
 SUNSET_NOTICE_MINUTES = _env_int("SUNSET_NOTICE_MINUTES", 60)
 _last_posted_weather_snapshot = None
 _last_posted_weather_epoch = 0
-_latest_weather_snapshot = None
 _last_storm_follow_up_check_epoch = 0
 _last_storm_follow_up_epoch = 0
 _last_sunrise_notice_date = None
 _last_sunset_notice_date = None
-_pressure_history = []
 RIVER_GAUGES = {
     "PIAI2": "Illinois River at Peoria",
     "PRAI2": "Illinois River at Peoria Lock and Dam",
@@ -232,6 +760,281 @@ RIVER_POST_KEEPALIVE_SECONDS = 12 * 3600
 _last_river_check_epoch = 0
 PEORIA_TIMEZONE = ZoneInfo("America/Chicago")
 PEORIA_LOCATION = LocationInfo("Peoria", "USA", "America/Chicago", NWS_POINT_LAT, NWS_POINT_LON)
+# Solar times are computed once per local date; optionally the whole year up front at startup.
+SOLAR_PRECOMPUTE_YEAR = os.getenv("WEATHERBOT_SOLAR_PRECOMPUTE_YEAR", "").strip().lower() in {"1", "true", "yes"}
+SOLAR_CACHE_MAX_DAYS = 400
+_sun_times_cache = {}
+
+# Persistent state: one SQLite (WAL) database with a table per source.
+# The *_FILE names above are the legacy JSON files, imported once on first open.
+STATE_DB_FILE = os.getenv("WEATHERBOT_STATE_DB", "weatherbot_state.sqlite3")
+STATE_TABLE_IMPORTS = {
+    "alert_history": ALERT_HISTORY_FILE,
+    "spc_history": SPC_HISTORY_FILE,
+    "earthquake_history": EARTHQUAKE_HISTORY_FILE,
+    "forecast_product_history": FORECAST_PRODUCT_HISTORY_FILE,
+    "river_history": RIVER_HISTORY_FILE,
+    "post_state": POST_STATE_FILE,
+}
+_state_db_connection = None
+_state_db_lock = threading.RLock()
+_state_tables = []
+STATE_TTL_BUCKET_SECONDS = 15 * 60
+
+
+def _state_updated_epoch(value, default: float) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, dict) and isinstance(value.get("updated"), (int, float)):
+        return float(value["updated"])
+    return default
+
+
+def _legacy_state_rows(table: str, payload: dict) -> dict:
+    if table != "river_history":
+        return payload
+    gauges = dict(payload.get("gauges") or {})
+    # The original river history was a flat record for PIAI2 only.
+    if payload.get("observed_category") and "PIAI2" not in gauges:
+        gauges["PIAI2"] = {
+            key: payload[key]
+            for key in (
+                "last_posted_epoch",
+                "observed_category",
+                "forecast_category",
+                "observed_stage",
+                "forecast_stage",
+                "last_checked_epoch",
+            )
+            if key in payload
+        }
+    return gauges
+
+
+def _import_json_state(connection: sqlite3.Connection):
+    """Copy each legacy JSON history into its table once, so dedupe state survives the migration."""
+    for table, path in STATE_TABLE_IMPORTS.items():
+        if not os.path.exists(path):
+            continue
+        if connection.execute("SELECT 1 FROM state_imports WHERE source = ?", (path,)).fetchone():
+            continue
+        try:
+            with open(path, "r") as file:
+                rows = _legacy_state_rows(table, json.load(file))
+        except Exception as e:
+            logging.error(f"Error importing {path} into {STATE_DB_FILE}: {e}")
+            continue
+
+        now_epoch = time.time()
+        with connection:
+            connection.executemany(
+                f"INSERT OR IGNORE INTO {table} (key, value, updated) VALUES (?, ?, ?)",
+                [
+                    (key, json.dumps(value), _state_updated_epoch(value, now_epoch))
+                    for key, value in rows.items()
+                ],
+            )
+            connection.execute(
+                "INSERT INTO state_imports (source, imported_epoch) VALUES (?, ?)",
+                (path, now_epoch),
+            )
+        logging.info("Imported %s entries from %s into %s.", len(rows), path, table)
+
+
+def _state_db() -> sqlite3.Connection:
+    global _state_db_connection
+    with _state_db_lock:
+        if _state_db_connection is None:
+            connection = sqlite3.connect(STATE_DB_FILE, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS state_imports (source TEXT PRIMARY KEY, imported_epoch REAL NOT NULL)"
+                )
+                for table in STATE_TABLE_IMPORTS:
+                    connection.execute(
+                        f"CREATE TABLE IF NOT EXISTS {table} "
+                        "(key TEXT PRIMARY KEY, value TEXT NOT NULL, updated REAL NOT NULL)"
+                    )
+                    connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_updated ON {table} (updated)")
+            _import_json_state(connection)
+            _state_db_connection = connection
+        return _state_db_connection
+
+
+class TTLIndex:
+    """Expiry index grouping keys into fixed-width time buckets.
+
+    expire() drops whole buckets older than the cutoff and inspects keys only
+    in the one bucket straddling it, so its cost follows the number of expired
+    keys rather than the size of the history.
+    """
+
+    def __init__(self, bucket_seconds: float = STATE_TTL_BUCKET_SECONDS):
+        self.bucket_seconds = bucket_seconds
+        self._buckets = {}
+        self._bucket_ids = []
+        self._key_buckets = {}
+
+    def __len__(self) -> int:
+        return len(self._key_buckets)
+
+    def epoch(self, key: str) -> float:
+        return self._buckets[self._key_buckets[key]][key]
+
+    def add(self, key: str, epoch: float):
+        self.discard(key)
+        bucket_id = int(epoch // self.bucket_seconds)
+        bucket = self._buckets.get(bucket_id)
+        if bucket is None:
+            bucket = self._buckets[bucket_id] = {}
+            heapq.heappush(self._bucket_ids, bucket_id)
+        bucket[key] = epoch
+        self._key_buckets[key] = bucket_id
+
+    def discard(self, key: str):
+        bucket_id = self._key_buckets.pop(key, None)
+        if bucket_id is not None:
+            # Emptied buckets stay in the heap until expire() reaches them.
+            del self._buckets[bucket_id][key]
+
+    def expire(self, cutoff: float) -> list:
+        """Remove and return every key whose epoch is older than cutoff."""
+        expired = []
+        while self._bucket_ids:
+            bucket_id = self._bucket_ids[0]
+            bucket = self._buckets[bucket_id]
+            if (bucket_id + 1) * self.bucket_seconds <= cutoff:
+                heapq.heappop(self._bucket_ids)
+                del self._buckets[bucket_id]
+                for key in bucket:
+                    del self._key_buckets[key]
+                expired.extend(bucket)
+                continue
+            if bucket_id * self.bucket_seconds < cutoff:
+                stale = [key for key, epoch in bucket.items() if epoch < cutoff]
+                for key in stale:
+                    del bucket[key]
+                    del self._key_buckets[key]
+                expired.extend(stale)
+            break
+        return expired
+
+
+class StateTable:
+    """Resident copy of one per-source table in the state database.
+
+    Rows are loaded once and then read and written in memory. flush() writes
+    only the keys changed since the last flush, plus any pending TTL expiry, in
+    a single transaction, so disk I/O follows new events rather than check
+    frequency.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._rows = None
+        self._ttl = TTLIndex()
+        self._dirty = set()
+        self._expire_before = None
+        self._lock = threading.RLock()
+        _state_tables.append(self)
+
+    def _loaded(self) -> dict:
+        if self._rows is None:
+            with _state_db_lock:
+                rows = _state_db().execute(f"SELECT key, value, updated FROM {self.name}").fetchall()
+            self._rows = {key: json.loads(value) for key, value, _ in rows}
+            for key, _, updated in rows:
+                self._ttl.add(key, updated)
+        return self._rows
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            return self._loaded().get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._loaded()
+
+    def __getitem__(self, key: str):
+        with self._lock:
+            return self._loaded()[key]
+
+    def __setitem__(self, key: str, value):
+        self.update({key: value})
+
+    def update(self, items: dict):
+        now_epoch = time.time()
+        with self._lock:
+            rows = self._loaded()
+            for key, value in items.items():
+                rows[key] = value
+                self._ttl.add(key, _state_updated_epoch(value, now_epoch))
+                self._dirty.add(key)
+
+    def items(self) -> list:
+        with self._lock:
+            return list(self._loaded().items())
+
+    def keys_with_prefix(self, prefix: str) -> list:
+        with self._lock:
+            return [key for key in self._loaded() if key.startswith(prefix)]
+
+    def expire(self, max_age_seconds: float) -> int:
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            rows = self._loaded()
+            expired = self._ttl.expire(cutoff)
+            for key in expired:
+                rows.pop(key, None)
+                self._dirty.discard(key)
+            if expired:
+                self._expire_before = max(cutoff, self._expire_before or cutoff)
+        return len(expired)
+
+    def flush(self) -> int:
+        with self._lock:
+            if not self._dirty and self._expire_before is None:
+                return 0
+            # Serialize before the dirty set is cleared: checks on the pool may be
+            # changing a row right now, and one that cannot be serialized stays
+            # dirty for the next flush instead of being dropped.
+            try:
+                rows = [(key, json.dumps(self._rows[key]), self._ttl.epoch(key)) for key in self._dirty]
+            except (TypeError, ValueError, RuntimeError) as e:
+                logging.error(f"Error serializing {self.name} for {STATE_DB_FILE}: {e}")
+                return 0
+            dirty = self._dirty
+            expire_before = self._expire_before
+            self._dirty = set()
+            self._expire_before = None
+            try:
+                with _state_db_lock:
+                    connection = _state_db()
+                    with connection:
+                        if expire_before is not None:
+                            connection.execute(f"DELETE FROM {self.name} WHERE updated < ?", (expire_before,))
+                        connection.executemany(
+                            f"INSERT OR REPLACE INTO {self.name} (key, value, updated) VALUES (?, ?, ?)",
+                            rows,
+                        )
+            except sqlite3.Error as e:
+                logging.error(f"Error flushing {self.name} to {STATE_DB_FILE}: {e}")
+                self._dirty |= dirty
+                if expire_before is not None:
+                    self._expire_before = max(expire_before, self._expire_before or expire_before)
+                return 0
+        return len(rows)
+
+
+def flush_state_tables():
+    written = sum(table.flush() for table in _state_tables)
+    if written:
+        logging.info("State store: wrote %s changed rows.", written)
+
+
+_post_state = StateTable("post_state")
 
 
 # Safely initialize Bluesky session
@@ -267,6 +1070,8 @@ def initialize_bsky_session():
 
 
 session = initialize_bsky_session()
+# Source checks can run concurrently; keep Bluesky session use to one thread at a time.
+_bluesky_lock = threading.RLock()
 
 # Initialize Mastodon client
 mastodon = Mastodon(
@@ -347,13 +1152,33 @@ def _friendly_time(dt: datetime | None = None) -> str:
     return dt.strftime("%I:%M %p").lstrip("0")
 
 
+def _sun_times_for_date(day: date) -> dict:
+    sun_times = _sun_times_cache.get(day)
+    if sun_times is None:
+        sun_times = sun(PEORIA_LOCATION.observer, date=day, tzinfo=PEORIA_TIMEZONE)
+        if len(_sun_times_cache) >= SOLAR_CACHE_MAX_DAYS:
+            _sun_times_cache.pop(min(_sun_times_cache), None)
+        _sun_times_cache[day] = sun_times
+    return sun_times
+
+
+def precompute_sun_times(year: int):
+    """Fill the solar cache for every date in year (plus the next New Year's Day)."""
+    started = time.perf_counter()
+    day = date(year, 1, 1)
+    while day <= date(year + 1, 1, 1):
+        _sun_times_for_date(day)
+        day += timedelta(days=1)
+    logging.info("Precomputed %s sunrise/sunset times in %.1f ms.", year, (time.perf_counter() - started) * 1000)
+
+
 def _sun_times(now: datetime | None = None) -> dict:
     now = now or datetime.now(PEORIA_TIMEZONE)
     if now.tzinfo is None:
         now = now.replace(tzinfo=PEORIA_TIMEZONE)
     else:
         now = now.astimezone(PEORIA_TIMEZONE)
-    return sun(PEORIA_LOCATION.observer, date=now.date(), tzinfo=PEORIA_TIMEZONE)
+    return _sun_times_for_date(now.date())
 
 
 def _is_daylight(now: datetime | None = None) -> bool:
@@ -516,23 +1341,17 @@ def _save_post_state():
         "last_sunrise_notice_date": _last_sunrise_notice_date,
         "last_sunset_notice_date": _last_sunset_notice_date,
     }
-    try:
-        with open(POST_STATE_FILE, "w") as file:
-            json.dump(payload, file)
-    except Exception as e:
-        logging.error(f"Error saving post state: {e}")
+    _post_state.update(payload)
 
 
 def _load_post_state():
     global _last_posted_weather_snapshot, _last_posted_weather_epoch
     global _last_sunrise_notice_date, _last_sunset_notice_date
 
-    if not os.path.exists(POST_STATE_FILE):
-        return
-
     try:
-        with open(POST_STATE_FILE, "r") as file:
-            payload = json.load(file)
+        payload = dict(_post_state.items())
+        if not payload:
+            return
 
         snapshot = _deserialize_snapshot(payload.get("last_posted_weather_snapshot"))
         epoch = float(payload.get("last_posted_weather_epoch", 0) or 0)
@@ -546,7 +1365,7 @@ def _load_post_state():
                 _last_posted_weather_epoch = snapshot["observed_at"].timestamp()
             logging.info(
                 "Restored last posted weather state from %s (%s, mode=%s).",
-                POST_STATE_FILE,
+                STATE_DB_FILE,
                 _snapshot_log_summary(snapshot),
                 snapshot.get("post_mode", "unknown"),
             )
@@ -797,24 +1616,133 @@ def _collapse_whitespace(text: str | None) -> str | None:
     return cleaned or None
 
 
-def _extract_nws_bullet(description: str, label: str) -> str | None:
-    marker = f"* {label.upper()}..."
-    collecting = False
-    collected = []
+# NWS text products are tokenized once: a single scan finds the $$ segment breaks, ".HEADING..."
+# sections, && terminators and "* LABEL..." bullets. "Label..." lines (SPC discussions) match
+# most prose lines in an AFD, so they are only scanned for when asked. Tokens anchor on a
+# newline, which the regex engine can skip to directly; the scanned text gets one prepended.
+# Matching is case-sensitive: headings are upper case, so a prose line such as
+# ".but not until later..." is not mistaken for one.
+_NWS_TOKEN_PATTERN = (
+    r"\n[ \t]*(?:(?P<segment_end>\$\$)[ \t]*$"
+    r"|(?P<section_end>&&)"
+    r"|\.(?P<heading>[A-Z][A-Z0-9 /]+)\.\.\."
+    r"|\* (?P<bullet>.*?)\.\.\."
+)
+_NWS_TOKEN = re.compile(_NWS_TOKEN_PATTERN + ")", re.MULTILINE)
+_NWS_TOKEN_WITH_LABELS = re.compile(
+    _NWS_TOKEN_PATTERN + r"|(?P<label>[A-Z][A-Za-z /]+)\.\.\.)",
+    re.MULTILINE,
+)
+_NWS_TOKEN_INDEXES = {
+    "heading": "sections",
+    "section_end": "sections",
+    "bullet": "bullets",
+    "label": "labels",
+}
+
+
+class NWSTextSegment:
+    """One $$-delimited segment of an NWS text product.
+
+    Each index maps an upper-cased name to the (start, end) offsets of its
+    body, first occurrence wins. Sections run to the next heading or &&,
+    bullets to the next bullet, and labels to the next label or blank line.
+    Bodies are only sliced out when looked up.
+    """
+
+    __slots__ = ("source", "start", "end", "sections", "bullets", "labels", "_open")
+
+    def __init__(self, source: str, start: int):
+        self.source = source
+        self.start = start
+        self.end = len(source)
+        self.sections = {}
+        self.bullets = {}
+        self.labels = {}
+        self._open = {}
+
+    @property
+    def text(self) -> str:
+        return self.source[self.start:self.end]
+
+    def _mark(self, index_name: str, line_start: int, name: str | None = None, body_start: int = 0):
+        previous = self._open.get(index_name)
+        if previous is not None:
+            getattr(self, index_name).setdefault(previous[0], (previous[1], line_start))
+        self._open[index_name] = (name.strip().upper(), body_start) if name is not None else None
+
+    def _close(self, end: int):
+        for index_name in list(self._open):
+            self._mark(index_name, end)
+        self.end = end
+
+    def block(self, index_name: str, name: str) -> list | None:
+        """Stripped body lines of one section, bullet or label, or None if absent."""
+        span = getattr(self, index_name).get(name.upper())
+        if span is None:
+            return None
+        body = self.source[span[0]:span[1]]
+        if index_name == "labels":
+            body = body.split("\n\n", 1)[0]
+        return [line.strip() for line in body.splitlines()]
 
-    for raw_line in description.splitlines():
-        line = raw_line.strip()
-        if line.startswith("* ") and "..." in line:
-            if collecting:
-                break
-            if line.upper().startswith(marker):
-                collecting = True
-                collected.append(line.split("...", 1)[1])
-            continue
-        if collecting:
-            collected.append(line)
 
-    return _collapse_whitespace(" ".join(collected))
+class NWSTextProduct:
+    """An NWS text product tokenized in one forward pass.
+
+    Lookups pull tokens only until the block they want is complete, so a
+    section near the top costs no more than a targeted search, and later
+    lookups continue the same scan instead of rescanning the text.
+    """
+
+    __slots__ = ("segments", "_source", "_tokens")
+
+    def __init__(self, product_text: str, labels: bool = False):
+        self._source = "\n" + (product_text or "")
+        pattern = _NWS_TOKEN_WITH_LABELS if labels else _NWS_TOKEN
+        self._tokens = pattern.finditer(self._source)
+        self.segments = [NWSTextSegment(self._source, 1)]
+
+    def _advance(self):
+        segment = self.segments[-1]
+        token = next(self._tokens, None)
+        if token is None:
+            segment._close(len(self._source))
+            self._tokens = None
+        elif token.lastgroup == "segment_end":
+            segment._close(token.start())
+            self.segments.append(NWSTextSegment(self._source, token.end()))
+        else:
+            kind = token.lastgroup
+            name = None if kind == "section_end" else token[kind]
+            segment._mark(_NWS_TOKEN_INDEXES[kind], token.start(), name, token.end())
+
+    def iter_segments(self):
+        """Yield each $$ segment as soon as it has been fully tokenized."""
+        index = 0
+        while True:
+            complete = len(self.segments) if self._tokens is None else len(self.segments) - 1
+            while index < complete:
+                yield self.segments[index]
+                index += 1
+            if self._tokens is None:
+                return
+            self._advance()
+
+    def block(self, index_name: str, name: str) -> list | None:
+        """First matching section, bullet or label in any segment, or None."""
+        while True:
+            for segment in self.segments:
+                block = segment.block(index_name, name)
+                if block is not None:
+                    return block
+            if self._tokens is None:
+                return None
+            self._advance()
+
+
+def _extract_nws_bullet(product: NWSTextProduct, label: str) -> str | None:
+    return _collapse_whitespace(" ".join(product.block("bullets", label) or []))
 
 
 def _extract_river_stage_lines(description: str) -> list[str]:
@@ -844,9 +1772,10 @@ def _extract_river_stage_lines(description: str) -> list[str]:
 
 def _format_nws_alert_summary_lines(properties: dict) -> list[str]:
     description = properties.get("description") or ""
+    product = NWSTextProduct(description)
     summary_lines = []
     for label in ("WHAT", "WHERE", "WHEN"):
-        value = _extract_nws_bullet(description, label)
+        value = _extract_nws_bullet(product, label)
         if value:
             summary_lines.append(f"{label.title()}: {value}")
 
@@ -882,41 +1811,26 @@ def _nws_office_source_url(properties: dict) -> str:
     return "https://www.weather.gov/alerts"
 
 
-def _load_alert_history() -> dict:
-    if os.path.exists(ALERT_HISTORY_FILE):
-        try:
-            with open(ALERT_HISTORY_FILE, "r") as file:
-                return json.load(file)
-        except Exception as e:
-            logging.error(f"Error loading alert history: {e}")
-    return {}
-
-
-def _save_alert_history(history: dict):
-    try:
-        with open(ALERT_HISTORY_FILE, "w") as file:
-            json.dump(history, file)
-    except Exception as e:
-        logging.error(f"Error saving alert history: {e}")
+_alert_history = StateTable("alert_history")
 
 
-def _cleanup_alert_history(history: dict) -> dict:
-    now_epoch = time.time()
-    return {key: value for key, value in history.items() if now_epoch - value < 86400}
+def _nws_alerts_url() -> str:
+    return f"https://api.weather.gov/alerts/active?zone={NWS_ALERT_ZONE}"
 
 
-def fetch_nws_alerts():
-    url = f"https://api.weather.gov/alerts/active?zone={NWS_ALERT_ZONE}"
+def fetch_nws_alerts(conditional: bool = False):
+    url = _nws_alerts_url()
     try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=15,
-        )
+        response = _http_get("nws", url, conditional=conditional)
         response.raise_for_status()
         return response.json().get("features", [])
     except requests.RequestException as e:
         logging.error(f"Error fetching NWS alerts: {e}")
+        _discard_http_validators(url)
+        return []
+    except ValueError as e:
+        logging.error(f"Error parsing NWS alerts: {e}")
+        _discard_http_validators(url)
         return []
 
 
@@ -954,11 +1868,7 @@ def _get_nws_forecast_url() -> str | None:
 
     url = f"https://api.weather.gov/points/{NWS_POINT_LAT},{NWS_POINT_LON}"
     try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=15,
-        )
+        response = _http_get("nws", url)
         response.raise_for_status()
         _nws_forecast_url = response.json().get("properties", {}).get("forecast")
         return _nws_forecast_url
@@ -992,11 +1902,7 @@ def fetch_nws_forecast_peek() -> str | None:
         return None
 
     try:
-        response = requests.get(
-            forecast_url,
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=15,
-        )
+        response = _http_get("nws", forecast_url)
         response.raise_for_status()
         periods = response.json().get("properties", {}).get("periods", [])
         for period in periods[:2]:
@@ -1015,6 +1921,12 @@ def fetch_nws_forecast_peek() -> str | None:
     return None
 
 
+def _nws_alert_priority(properties: dict) -> int:
+    if "WARNING" in str(properties.get("event") or "").upper():
+        return POST_PRIORITY_URGENT
+    return POST_PRIORITY_HIGH
+
+
 def _normalized_nws_alert_id(alert_id: str) -> str:
     base_id, separator, suffix = str(alert_id).rpartition(".")
     if separator and suffix.isdigit():
@@ -1026,17 +1938,19 @@ def check_nws_alerts(force: bool = False):
     global _last_nws_alert_check_epoch
 
     now_epoch = time.time()
-    if not force and now_epoch - _last_nws_alert_check_epoch < 5 * 60:
+    if not force and now_epoch - _last_nws_alert_check_epoch < NWS_ALERT_CHECK_INTERVAL:
         return
     _last_nws_alert_check_epoch = now_epoch
 
-    history = _cleanup_alert_history(_load_alert_history())
-    alerts = fetch_nws_alerts()
-
-    if not alerts:
-        _save_alert_history(history)
+    try:
+        alerts = fetch_nws_alerts(conditional=not force)
+    except HTTPNotModified:
+        logging.info("NWS alerts: unchanged since last check.")
         return
 
+    history = _alert_history
+    history.expire(ALERT_HISTORY_TTL_SECONDS)
+
     for alert in alerts:
         properties = alert.get("properties", {})
         alert_id = alert.get("id", "unknown")
@@ -1052,29 +1966,12 @@ def check_nws_alerts(force: bool = False):
             continue
 
         alert_message = format_nws_alert_post(alert)
-        post_to_bluesky(alert_message)
-        send_telegram_message(alert_message)
+        enqueue_post(alert_message, label="NWS alert", priority=_nws_alert_priority(properties))
         history[history_key] = now_epoch
-
-    _save_alert_history(history)
-
-
-def _load_spc_history() -> dict:
-    if os.path.exists(SPC_HISTORY_FILE):
-        try:
-            with open(SPC_HISTORY_FILE, "r") as file:
-                return json.load(file)
-        except Exception as e:
-            logging.error(f"Error loading SPC history: {e}")
-    return {}
+    _commit_http_validators(_nws_alerts_url())
 
 
-def _save_spc_history(history: dict):
-    try:
-        with open(SPC_HISTORY_FILE, "w") as file:
-            json.dump(history, file)
-    except Exception as e:
-        logging.error(f"Error saving SPC history: {e}")
+_spc_history = StateTable("spc_history")
 
 
 def _download_official_image(image_url: str | None, image_name: str) -> str | None:
@@ -1086,11 +1983,7 @@ def _download_official_image(image_url: str | None, image_name: str) -> str | No
         extension = os.path.splitext(image_url.split("?", 1)[0])[1] or ".png"
         safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", image_name).strip("_") or "official_weather_image"
         image_path = os.path.join(OFFICIAL_IMAGE_CACHE_DIR, f"{safe_name}{extension}")
-        response = requests.get(
-            image_url,
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=20,
-        )
+        response = _http_get("spc", image_url)
         response.raise_for_status()
         content_type = response.headers.get("Content-Type", "")
         if not content_type.startswith("image/"):
@@ -1112,13 +2005,14 @@ def post_to_bluesky_with_official_image(message: str, image_url: str | None, alt
         return False
 
     post_message = _fit_bluesky_text(message)
-    image_path = _download_official_image(image_url, f"spc_{int(time.time())}")
+    image_path = _download_official_image(image_url, f"spc_{time.time_ns()}")
     if not image_path:
         logging.info("Bluesky: official image unavailable, falling back to text-only post.")
         return post_to_bluesky(message)
 
     try:
-        post_image(session, post_message, image_path, alt_text=alt_text)
+        with _bluesky_lock:
+            post_image(session, post_message, image_path, alt_text=alt_text)
         logging.info("Bluesky: Weather data posted with official image.")
         return True
     except Exception as e:
@@ -1127,107 +2021,314 @@ def post_to_bluesky_with_official_image(message: str, image_url: str | None, alt
 
 
 def send_telegram_photo(message: str, image_url: str | None) -> bool:
-    image_path = _download_official_image(image_url, f"telegram_{int(time.time())}")
+    image_path = _download_official_image(image_url, f"telegram_{time.time_ns()}")
     if not image_path:
         logging.info("Telegram: official image unavailable, falling back to text-only message.")
-        send_telegram_message(message)
-        return False
+        return send_telegram_message(message)
 
     try:
-        bot = Bot(token=TELEGRAM_TOKEN)
         caption = message
         if len(caption) > 1024:
             caption = caption[:1021].rstrip() + "..."
 
-        async def _send_photo():
+        async def _send_photo(bot):
             with open(image_path, "rb") as photo:
                 await bot.send_photo(chat_id=TELEGRAM_CHAT_ID, photo=photo, caption=caption)
 
-        asyncio.run(_send_photo())
-        logging.info("Telegram: Photo sent with official image.")
+        result = telegram_sender.send(_send_photo)
+        logging.info("Telegram: Photo sent with official image in %.2fs.", result["latency"])
         return True
+    except TelegramSendUnconfirmed:
+        raise
     except Exception as e:
         logging.error(f"Telegram: Sending photo failed. Falling back to text-only. Error: {e}")
-        send_telegram_message(message)
-        return False
+        return send_telegram_message(message)
 
 
 def _spc_risk_rank(label: str | None) -> int:
     return SPC_RISK_RANKS.get(str(label or "").upper(), 0)
 
 
-def _point_in_ring(lon: float, lat: float, ring: list) -> bool:
-    inside = False
-    if len(ring) < 3:
-        return False
-
-    j = len(ring) - 1
-    for i, point in enumerate(ring):
-        prev = ring[j]
+def _prepare_ring(ring: list) -> dict | None:
+    """Convert a GeoJSON ring to float vertices once, with its bounding box and edge terms."""
+    xs = []
+    ys = []
+    for point in ring or []:
         try:
-            xi, yi = float(point[0]), float(point[1])
-            xj, yj = float(prev[0]), float(prev[1])
+            xs.append(float(point[0]))
+            ys.append(float(point[1]))
         except (TypeError, ValueError, IndexError):
-            j = i
             continue
+    if len(xs) < 3:
+        return None
+
+    prepared = {"bbox": (min(xs), min(ys), max(xs), max(ys))}
+    # Edge i runs from the previous vertex (j) to vertex i, as in a classic ray cast.
+    xj = xs[-1:] + xs[:-1]
+    yj = ys[-1:] + ys[:-1]
+    if np is not None:
+        xs_arr = np.asarray(xs)
+        ys_arr = np.asarray(ys)
+        xj_arr = np.asarray(xj)
+        yj_arr = np.asarray(yj)
+        dy = yj_arr - ys_arr
+        dy[dy == 0] = 1e-12
+        prepared.update({
+            "xs": xs_arr,
+            "ys": ys_arr,
+            "slope": (xj_arr - xs_arr) / dy,
+            "yj": yj_arr,
+            "y_low": np.minimum(ys_arr, yj_arr),
+            "y_high": np.maximum(ys_arr, yj_arr),
+        })
+    else:
+        prepared["edges"] = list(zip(xs, ys, xj, yj))
+    return prepared
+
+
+def _point_in_prepared_ring(lon: float, lat: float, ring: dict) -> bool:
+    min_x, min_y, max_x, max_y = ring["bbox"]
+    if lon < min_x or lon > max_x or lat < min_y or lat > max_y:
+        return False
+
+    if np is not None:
+        ys = ring["ys"]
+        crosses = (ys > lat) != (ring["yj"] > lat)
+        intersects = crosses & (lon < ring["slope"] * (lat - ys) + ring["xs"])
+        return bool(np.count_nonzero(intersects) % 2)
 
+    inside = False
+    for xi, yi, xj, yj in ring["edges"]:
         intersects = ((yi > lat) != (yj > lat)) and (
             lon < (xj - xi) * (lat - yi) / ((yj - yi) or 1e-12) + xi
         )
         if intersects:
             inside = not inside
-        j = i
+    return inside
 
+
+def _prepare_geojson_geometry(geometry: dict) -> list:
+    """Return prepared polygons (outer ring first, then holes) for a Polygon/MultiPolygon."""
+    geometry_type = (geometry or {}).get("type")
+    coordinates = (geometry or {}).get("coordinates") or []
+
+    if geometry_type == "Polygon":
+        polygons = [coordinates]
+    elif geometry_type == "MultiPolygon":
+        polygons = coordinates
+    else:
+        return []
+
+    prepared = []
+    for polygon in polygons:
+        if not polygon:
+            continue
+        outer = _prepare_ring(polygon[0])
+        if outer is None:
+            continue
+        holes = [ring for ring in (_prepare_ring(hole) for hole in polygon[1:]) if ring is not None]
+        prepared.append([outer] + holes)
+    return prepared
+
+
+def _points_in_prepared_ring(lons, lats, ring: dict):
+    """Test NumPy arrays of points against one ring, returning a boolean array.
+
+    Only points inside the ring's bounding box, and only edges whose latitude
+    span reaches one of those points, go into the broadcast, so the array work
+    is (edges near the points) x (points in the box) rather than every vertex
+    against every point.
+    """
+    min_x, min_y, max_x, max_y = ring["bbox"]
+    in_box = (lons >= min_x) & (lons <= max_x) & (lats >= min_y) & (lats <= max_y)
+    inside = np.zeros(len(lons), dtype=bool)
+    candidates = np.nonzero(in_box)[0]
+    if not len(candidates):
+        return inside
+
+    px = lons[candidates]
+    py = lats[candidates]
+    edges = np.nonzero((ring["y_high"] >= py.min()) & (ring["y_low"] <= py.max()))[0]
+    if not len(edges):
+        return inside
+    ys = ring["ys"][edges, None]
+    crosses = (ys > py) != (ring["yj"][edges, None] > py)
+    intersects = crosses & (px < ring["slope"][edges, None] * (py - ys) + ring["xs"][edges, None])
+    inside[candidates] = np.count_nonzero(intersects, axis=0) % 2 == 1
     return inside
 
 
-def _point_in_polygon(lon: float, lat: float, polygon: list) -> bool:
-    if not polygon or not _point_in_ring(lon, lat, polygon[0]):
-        return False
-    return not any(_point_in_ring(lon, lat, hole) for hole in polygon[1:])
+def _point_in_prepared_geometry(lon: float, lat: float, polygons: list) -> bool:
+    for outer, *holes in polygons:
+        if _point_in_prepared_ring(lon, lat, outer) and not any(
+            _point_in_prepared_ring(lon, lat, hole) for hole in holes
+        ):
+            return True
+    return False
 
 
 def _point_in_geojson_geometry(lon: float, lat: float, geometry: dict) -> bool:
-    geometry_type = geometry.get("type")
-    coordinates = geometry.get("coordinates") or []
+    return _point_in_prepared_geometry(lon, lat, _prepare_geojson_geometry(geometry))
 
-    if geometry_type == "Polygon":
-        return _point_in_polygon(lon, lat, coordinates)
-    if geometry_type == "MultiPolygon":
-        return any(_point_in_polygon(lon, lat, polygon) for polygon in coordinates)
-    return False
 
+def _prepare_spc_features(data: dict) -> list:
+    """Prepare every outlook feature once: polygons plus an overall bounding box for rejection."""
+    prepared = []
+    for feature in data.get("features", []):
+        polygons = _prepare_geojson_geometry(feature.get("geometry") or {})
+        if not polygons:
+            continue
+        outer_boxes = [polygon[0]["bbox"] for polygon in polygons]
+        prepared.append({
+            "bbox": (
+                min(box[0] for box in outer_boxes),
+                min(box[1] for box in outer_boxes),
+                max(box[2] for box in outer_boxes),
+                max(box[3] for box in outer_boxes),
+            ),
+            "polygons": polygons,
+            "properties": feature.get("properties") or {},
+        })
+    return prepared
+
+
+def _spc_features_at_points(prepared_features: list, points: list) -> list:
+    """Return, for each (lon, lat) point, the properties of every feature containing it."""
+    matches = [[] for _ in points]
+    if not points:
+        return matches
+
+    if np is None:
+        for feature in prepared_features:
+            min_x, min_y, max_x, max_y = feature["bbox"]
+            for index, (lon, lat) in enumerate(points):
+                if (
+                    min_x <= lon <= max_x
+                    and min_y <= lat <= max_y
+                    and _point_in_prepared_geometry(lon, lat, feature["polygons"])
+                ):
+                    matches[index].append(feature["properties"])
+        return matches
+
+    # Bucket the points into each feature's bounding box with array masks, so
+    # the Python-level work per feature is per ring, not per point.
+    lons = np.asarray([point[0] for point in points], dtype=float)
+    lats = np.asarray([point[1] for point in points], dtype=float)
+    for feature in prepared_features:
+        min_x, min_y, max_x, max_y = feature["bbox"]
+        candidates = np.nonzero((lons >= min_x) & (lons <= max_x) & (lats >= min_y) & (lats <= max_y))[0]
+        if not len(candidates):
+            continue
+        candidate_lons = lons[candidates]
+        candidate_lats = lats[candidates]
+
+        contained = np.zeros(len(candidates), dtype=bool)
+        for outer, *holes in feature["polygons"]:
+            in_polygon = _points_in_prepared_ring(candidate_lons, candidate_lats, outer)
+            for hole in holes:
+                in_polygon &= ~_points_in_prepared_ring(candidate_lons, candidate_lats, hole)
+            contained |= in_polygon
+
+        for index in candidates[contained]:
+            matches[index].append(feature["properties"])
+    return matches
 
-def fetch_spc_outlook(product: dict) -> dict | None:
+
+def fetch_spc_outlook(product: dict, conditional: bool = False) -> dict | None:
     try:
-        response = requests.get(
-            product["geojson_url"],
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=15,
-        )
+        response = _http_get("spc", product["geojson_url"], conditional=conditional)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
         logging.error(f"Error fetching SPC {product['label']} outlook: {e}")
     except ValueError as e:
         logging.error(f"Error parsing SPC {product['label']} outlook: {e}")
+        _discard_http_validators(product["geojson_url"])
     return None
 
 
-def _spc_outlook_for_peoria(product: dict) -> dict | None:
-    data = fetch_spc_outlook(product)
-    if not data:
-        return None
+def _iter_geojson_features(response):
+    """Yield the features of a GeoJSON FeatureCollection response one at a time.
 
-    peoria_lon = NWS_POINT_LON
-    peoria_lat = NWS_POINT_LAT
-    matching_outlooks = []
-    for feature in data.get("features", []):
-        geometry = feature.get("geometry") or {}
-        if not _point_in_geojson_geometry(peoria_lon, peoria_lat, geometry):
+    Only the undecoded tail of the body is buffered. A feature split across
+    chunks is retried only after the buffer doubles, so large polygons are not
+    re-parsed on every chunk.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = response.iter_content(chunk_size=SPC_STREAM_CHUNK_BYTES)
+    buffer = ""
+    in_features = False
+    retry_at = 0
+    finished = False
+
+    while not finished:
+        chunk = next(chunks, None)
+        if chunk is None:
+            finished = True
+            buffer += text_decoder.decode(b"", final=True)
+        else:
+            buffer += text_decoder.decode(chunk)
+
+        if not in_features:
+            match = _GEOJSON_FEATURES_START.search(buffer)
+            if match is None:
+                continue
+            buffer = buffer[match.end():]
+            in_features = True
+
+        if len(buffer) < retry_at and not finished:
             continue
+        while True:
+            buffer = buffer.lstrip(" \t\r\n,")
+            if not buffer:
+                break
+            if buffer[0] == "]":
+                return
+            try:
+                feature, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                retry_at = len(buffer) * 2
+                break
+            buffer = buffer[end:]
+            retry_at = 0
+            yield feature
+
+    raise ValueError("GeoJSON response ended before its features array closed")
+
+
+def _stream_spc_layer(layer: dict, points: tuple, conditional: bool = False) -> tuple | None:
+    """Match each streamed feature against the points, then drop its coordinates.
+
+    Returns ``(matches, evaluate_ms)``; the 304 case raises HTTPNotModified as usual.
+    """
+    matches = [[] for _ in points]
+    evaluate_ms = 0.0
+    try:
+        response = _http_get("spc", layer["geojson_url"], conditional=conditional, stream=True)
+        with response:
+            response.raise_for_status()
+            for feature in _iter_geojson_features(response):
+                started = time.perf_counter()
+                prepared = _prepare_spc_features({"features": [feature]})
+                del feature
+                for index, matching_properties in enumerate(_spc_features_at_points(prepared, list(points))):
+                    matches[index].extend(matching_properties)
+                evaluate_ms += (time.perf_counter() - started) * 1000
+    except requests.RequestException as e:
+        logging.error(f"Error fetching SPC {layer['label']} outlook: {e}")
+        _discard_http_validators(layer["geojson_url"])
+        return None
+    except ValueError as e:
+        logging.error(f"Error parsing SPC {layer['label']} outlook: {e}")
+        _discard_http_validators(layer["geojson_url"])
+        return None
+    return matches, evaluate_ms
+
 
-        properties = feature.get("properties") or {}
+def _strongest_spc_outlook(product: dict, matching_properties: list) -> dict | None:
+    matching_outlooks = []
+    for properties in matching_properties:
         label = str(properties.get("LABEL", "")).upper()
         matching_outlooks.append({
             "label": label,
@@ -1250,131 +2351,285 @@ def _spc_outlook_for_peoria(product: dict) -> dict | None:
     return strongest
 
 
-def _spc_time_range(valid_iso: str | None, expire_iso: str | None) -> str | None:
-    valid_time = _format_alert_time(valid_iso)
-    expire_time = _format_alert_time(expire_iso)
-    if valid_time == "unknown" and expire_time == "unknown":
-        return None
-    if expire_time == "unknown":
-        return f"Valid from {valid_time}"
-    if valid_time == "unknown":
-        return f"Valid until {expire_time}"
-    return f"Valid {valid_time} to {expire_time}"
-
+def _record_spc_layer_timing(layer: dict, **timings):
+    with _spc_geojson_cache_lock:
+        _spc_layer_timings.setdefault(layer["key"], {}).update(timings)
 
-def format_spc_outlook_post(outlook: dict) -> str:
-    risk_label = outlook.get("label", "")
-    risk_name = SPC_RISK_NAMES.get(risk_label, outlook.get("name", risk_label))
-    product_label = outlook.get("product_label", "SPC outlook")
-    timing = _spc_time_range(outlook.get("valid"), outlook.get("expire"))
 
-    lines = [
-        f"🟧 SPC has Peoria in a {risk_name} for severe storms.",
-        "",
-        f"Outlook: {product_label}",
-    ]
-    if timing:
-        lines.append(f"Timing: {timing}")
-    lines.extend([
-        f"Source: {outlook.get('source_url')}",
-        "#peoriaweather",
-    ])
-    return "\n".join(lines)
+def _spc_layer_matches(layer: dict, points: tuple, conditional: bool = False) -> tuple | None:
+    """Matching feature properties for each (lon, lat) point in one SPC layer, as ``(matches, changed)``.
 
+    A 304 reuses the cached entry with changed=False. In streaming mode only the
+    results for the cached point set are kept, so a different point set (or no
+    cache at all, e.g. after a restart) fetches the layer unconditionally.
+    """
+    url = layer["geojson_url"]
+    with _spc_geojson_cache_lock:
+        cached = _spc_geojson_cache.get(url)
+    reusable = cached is not None and (cached.get("features") is not None or cached.get("points") == points)
+    conditional = conditional and reusable
 
-def check_spc_outlooks(force: bool = False):
-    global _last_spc_check_epoch
+    started = time.perf_counter()
+    try:
+        if SPC_STREAMING_PARSE:
+            streamed = _stream_spc_layer(layer, points, conditional=conditional)
+            if streamed is None:
+                return None
+            matches, evaluate_ms = streamed
+            entry = {"points": points, "matches": matches, "updated": time.time()}
+            _record_spc_layer_timing(
+                layer,
+                stream_ms=(time.perf_counter() - started) * 1000,
+                evaluate_ms=evaluate_ms,
+            )
+        else:
+            data = fetch_spc_outlook(layer, conditional=conditional)
+            if not data:
+                return None
+            prepare_started = time.perf_counter()
+            features = _prepare_spc_features(data)
+            del data
+            evaluate_started = time.perf_counter()
+            matches = _spc_features_at_points(features, list(points))
+            entry = {"features": features, "updated": time.time()}
+            _record_spc_layer_timing(
+                layer,
+                prepare_ms=(evaluate_started - prepare_started) * 1000,
+                evaluate_ms=(time.perf_counter() - evaluate_started) * 1000,
+            )
+    except HTTPNotModified:
+        if cached.get("features") is None:
+            return cached["matches"], False
+        evaluate_started = time.perf_counter()
+        matches = _spc_features_at_points(cached["features"], list(points))
+        _record_spc_layer_timing(layer, evaluate_ms=(time.perf_counter() - evaluate_started) * 1000)
+        return matches, False
+
+    with _spc_geojson_cache_lock:
+        _spc_geojson_cache[url] = entry
+    return matches, True
+
+
+def _spc_timing_summary() -> str:
+    with _spc_geojson_cache_lock:
+        timings = {key: dict(values) for key, values in _spc_layer_timings.items()}
+    return ", ".join(
+        f"{key} " + "/".join(
+            f"{name.removesuffix('_ms')} {value:.1f}ms" for name, value in sorted(values.items())
+        )
+        for key, values in sorted(timings.items())
+    ) or "none yet"
+
+
+def _spc_point_coordinates(points) -> tuple:
+    return tuple((point["lon"], point["lat"]) for point in points)
+
+
+def _spc_outlooks_from_matches(product: dict, points, matches: list) -> dict:
+    return {
+        point["name"]: _strongest_spc_outlook(product, matching_properties)
+        for point, matching_properties in zip(points, matches)
+    }
+
+
+def spc_outlook_for_points(product: dict, points: list, conditional: bool = False) -> dict | None:
+    """Strongest categorical outlook for each named point, from one download and one parse.
+
+    Points are dicts with ``name``, ``lat`` and ``lon``. Returns ``{name: outlook or None}``,
+    or None when the outlook could not be fetched.
+    """
+    layer_result = _spc_layer_matches(product, _spc_point_coordinates(points), conditional=conditional)
+    if layer_result is None:
+        return None
+    return _spc_outlooks_from_matches(product, points, layer_result[0])
+
+
+def _strongest_spc_probability(layer: dict, matching_properties: list) -> dict | None:
+    percent = 0
+    significant = False
+    for properties in matching_properties:
+        label = str(properties.get("LABEL", "")).upper()
+        if label == "SIGN":
+            significant = True
+            continue
+        try:
+            percent = max(percent, round(float(label) * 100))
+        except ValueError:
+            continue
+    if not percent:
+        return None
+    return {"name": layer["name"], "percent": percent, "significant": significant}
+
+
+def evaluate_spc_product(product: dict, conditional: bool = False) -> dict | None:
+    """Categorical risk at every local point plus Peoria's probabilistic risks for one outlook day.
+
+    Returns None when the categorical outlook could not be fetched. ``changed`` is False
+    only when every layer answered 304 Not Modified.
+    """
+    categorical = _spc_layer_matches(product, _spc_point_coordinates(SPC_LOCAL_POINTS), conditional=conditional)
+    if categorical is None:
+        return None
+    matches, changed = categorical
+    local_outlooks = _spc_outlooks_from_matches(product, SPC_LOCAL_POINTS, matches)
+
+    probabilities = []
+    for layer in product.get("probabilistic_layers", ()):
+        layer_result = _spc_layer_matches(layer, ((NWS_POINT_LON, NWS_POINT_LAT),), conditional=conditional)
+        if layer_result is None:
+            continue
+        layer_matches, layer_changed = layer_result
+        changed = changed or layer_changed
+        probability = _strongest_spc_probability(layer, layer_matches[0])
+        if probability:
+            probabilities.append(probability)
+
+    if changed:
+        logging.info(
+            "SPC %s local risk: %s. Peoria probabilities: %s.",
+            product["label"],
+            ", ".join(
+                f"{name} {outlook['label'] if outlook else 'none'}"
+                for name, outlook in local_outlooks.items()
+            ),
+            _spc_probability_text(probabilities) or "none",
+        )
+    return {
+        "outlook": local_outlooks.get("Peoria"),
+        "local_outlooks": local_outlooks,
+        "probabilities": probabilities,
+        "changed": changed,
+    }
+
+
+def _spc_probability_text(probabilities: list) -> str:
+    return ", ".join(
+        f"{probability['name']} {probability['percent']}%"
+        + (" (significant)" if probability["significant"] else "")
+        for probability in probabilities
+    )
+
+
+def _spc_time_range(valid_iso: str | None, expire_iso: str | None) -> str | None:
+    valid_time = _format_alert_time(valid_iso)
+    expire_time = _format_alert_time(expire_iso)
+    if valid_time == "unknown" and expire_time == "unknown":
+        return None
+    if expire_time == "unknown":
+        return f"Valid from {valid_time}"
+    if valid_time == "unknown":
+        return f"Valid until {expire_time}"
+    return f"Valid {valid_time} to {expire_time}"
+
+
+def format_spc_outlook_post(outlook: dict) -> str:
+    risk_label = outlook.get("label", "")
+    risk_name = SPC_RISK_NAMES.get(risk_label, outlook.get("name", risk_label))
+    product_label = outlook.get("product_label", "SPC outlook")
+    timing = _spc_time_range(outlook.get("valid"), outlook.get("expire"))
+
+    lines = [
+        f"🟧 SPC has Peoria in a {risk_name} for severe storms.",
+        "",
+        f"Outlook: {product_label}",
+    ]
+    if timing:
+        lines.append(f"Timing: {timing}")
+    probability_text = _spc_probability_text(outlook.get("probabilities") or [])
+    if probability_text:
+        lines.append(f"Probabilities: {probability_text}")
+    lines.extend([
+        f"Source: {outlook.get('source_url')}",
+        "#peoriaweather",
+    ])
+    return "\n".join(lines)
+
+
+def check_spc_outlooks(force: bool = False):
+    global _last_spc_check_epoch
 
     now_epoch = time.time()
     if not force and now_epoch - _last_spc_check_epoch < SPC_CHECK_INTERVAL:
         return
     _last_spc_check_epoch = now_epoch
 
-    history = _load_spc_history()
-    min_rank = _spc_risk_rank(SPC_MIN_POST_RISK)
-
     for product in SPC_OUTLOOK_PRODUCTS:
-        outlook = _spc_outlook_for_peoria(product)
-        if not outlook:
-            logging.info("SPC %s: Peoria is not inside a categorical outlook.", product["label"])
-            history[product["key"]] = {
-                "signature": "none",
-                "updated": now_epoch,
-            }
-            continue
+        _check_spc_product(product, now_epoch, conditional=not force)
+        _commit_http_validators(
+            product["geojson_url"],
+            *(layer["geojson_url"] for layer in product.get("probabilistic_layers", ())),
+        )
 
-        signature = "|".join([
-            outlook.get("product_key", ""),
-            outlook.get("label", ""),
-            str(outlook.get("issue") or ""),
-            str(outlook.get("valid") or ""),
-            str(outlook.get("expire") or ""),
-        ])
-        previous_signature = history.get(product["key"], {}).get("signature")
 
-        if outlook["rank"] < min_rank:
-            logging.info(
-                "SPC %s: Peoria is inside %s, below posting threshold.",
-                product["label"],
-                outlook.get("label", "unknown"),
-            )
-            history[product["key"]] = {
-                "signature": signature,
-                "updated": now_epoch,
-                "risk": outlook.get("label"),
-            }
-            continue
+def _check_spc_product(product: dict, now_epoch: float, conditional: bool):
+    history = _spc_history
+    min_rank = _spc_risk_rank(SPC_MIN_POST_RISK)
 
-        if signature == previous_signature:
-            logging.info(
-                "SPC %s: no posting change for Peoria (%s).",
-                product["label"],
-                outlook.get("label", "unknown"),
-            )
-            continue
+    result = evaluate_spc_product(product, conditional=conditional)
+    if result and not result["changed"]:
+        logging.info("SPC %s: outlook unchanged since last check.", product["label"])
+        return
+    outlook = result["outlook"] if result else None
+    if not outlook:
+        logging.info("SPC %s: Peoria is not inside a categorical outlook.", product["label"])
+        history[product["key"]] = {
+            "signature": "none",
+            "updated": now_epoch,
+        }
+        return
+
+    signature = "|".join([
+        outlook.get("product_key", ""),
+        outlook.get("label", ""),
+        str(outlook.get("issue") or ""),
+        str(outlook.get("valid") or ""),
+        str(outlook.get("expire") or ""),
+    ])
+    previous_signature = history.get(product["key"], {}).get("signature")
 
+    if outlook["rank"] < min_rank:
         logging.info(
-            "SPC %s: posting Peoria outlook update (%s).",
+            "SPC %s: Peoria is inside %s, below posting threshold.",
             product["label"],
             outlook.get("label", "unknown"),
         )
-        spc_message = format_spc_outlook_post(outlook)
-        post_to_bluesky_with_official_image(
-            spc_message,
-            outlook.get("image_url"),
-            f"Official SPC {outlook.get('product_label', 'outlook')} categorical outlook map.",
-        )
-        send_telegram_photo(spc_message, outlook.get("image_url"))
         history[product["key"]] = {
             "signature": signature,
             "updated": now_epoch,
             "risk": outlook.get("label"),
         }
+        return
 
-    _save_spc_history(history)
-
-
-def _load_earthquake_history() -> dict:
-    if os.path.exists(EARTHQUAKE_HISTORY_FILE):
-        try:
-            with open(EARTHQUAKE_HISTORY_FILE, "r") as file:
-                return json.load(file)
-        except Exception as e:
-            logging.error(f"Error loading earthquake history: {e}")
-    return {}
-
+    if signature == previous_signature:
+        logging.info(
+            "SPC %s: no posting change for Peoria (%s).",
+            product["label"],
+            outlook.get("label", "unknown"),
+        )
+        return
 
-def _save_earthquake_history(history: dict):
-    try:
-        with open(EARTHQUAKE_HISTORY_FILE, "w") as file:
-            json.dump(history, file)
-    except Exception as e:
-        logging.error(f"Error saving earthquake history: {e}")
+    logging.info(
+        "SPC %s: posting Peoria outlook update (%s).",
+        product["label"],
+        outlook.get("label", "unknown"),
+    )
+    outlook["probabilities"] = result["probabilities"]
+    spc_message = format_spc_outlook_post(outlook)
+    enqueue_post(
+        spc_message,
+        image_url=outlook.get("image_url"),
+        alt_text=f"Official SPC {outlook.get('product_label', 'outlook')} categorical outlook map.",
+        label=f"SPC {product['label']} outlook",
+        priority=POST_PRIORITY_NORMAL,
+    )
+    history[product["key"]] = {
+        "signature": signature,
+        "updated": now_epoch,
+        "risk": outlook.get("label"),
+    }
 
 
-def _cleanup_earthquake_history(history: dict) -> dict:
-    now_epoch = time.time()
-    return {key: value for key, value in history.items() if now_epoch - value < 7 * 86400}
+_earthquake_history = StateTable("earthquake_history")
 
 
 def _distance_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -1402,12 +2657,7 @@ def fetch_usgs_earthquakes():
         "orderby": "time",
     }
     try:
-        response = requests.get(
-            USGS_EARTHQUAKE_URL,
-            params=params,
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=15,
-        )
+        response = _http_get("usgs", USGS_EARTHQUAKE_URL, params=params)
         response.raise_for_status()
         return response.json().get("features", [])
     except requests.RequestException as e:
@@ -1498,12 +2748,12 @@ def check_usgs_earthquakes(force: bool = False):
         return
     _last_earthquake_check_epoch = now_epoch
 
-    history = _cleanup_earthquake_history(_load_earthquake_history())
+    history = _earthquake_history
+    history.expire(EARTHQUAKE_HISTORY_TTL_SECONDS)
     events = fetch_usgs_earthquakes()
 
     if not events:
         logging.info("USGS earthquake check: no regional events returned.")
-        _save_earthquake_history(history)
         return
 
     for event in events:
@@ -1521,34 +2771,16 @@ def check_usgs_earthquakes(force: bool = False):
 
         logging.info("USGS earthquake %s: posting update (%s).", event_id, reason)
         earthquake_message = format_earthquake_post(event)
-        post_to_bluesky(earthquake_message)
-        send_telegram_message(earthquake_message)
+        enqueue_post(earthquake_message, label="USGS earthquake", priority=POST_PRIORITY_NORMAL)
         history[event_id] = now_epoch
 
-    _save_earthquake_history(history)
-
-
-def _load_forecast_product_history() -> dict:
-    if os.path.exists(FORECAST_PRODUCT_HISTORY_FILE):
-        try:
-            with open(FORECAST_PRODUCT_HISTORY_FILE, "r") as file:
-                return json.load(file)
-        except Exception as e:
-            logging.error(f"Error loading forecast product history: {e}")
-    return {}
-
 
-def _save_forecast_product_history(history: dict):
-    try:
-        with open(FORECAST_PRODUCT_HISTORY_FILE, "w") as file:
-            json.dump(history, file)
-    except Exception as e:
-        logging.error(f"Error saving forecast product history: {e}")
+_forecast_product_history = StateTable("forecast_product_history")
 
 
-def _cleanup_forecast_product_history(history: dict) -> dict:
-    now_epoch = time.time()
-    return {key: value for key, value in history.items() if now_epoch - value < 7 * 86400}
+def _processed_lsr_product_ids(history: StateTable) -> set:
+    prefix = "LSRPRODUCT|"
+    return {key[len(prefix):] for key in history.keys_with_prefix(prefix)}
 
 
 def _product_source_url(product: dict) -> str:
@@ -1567,45 +2799,151 @@ def _has_notable_product_terms(text: str) -> bool:
     return any(term.lower() in lower_text for term in FORECAST_PRODUCT_NOTABLE_TERMS)
 
 
-def _fetch_latest_nws_product(product_url: str, product_name: str) -> dict | None:
+def _fetch_latest_nws_product(product_url: str, product_name: str, conditional: bool = False) -> dict | None:
     try:
-        response = requests.get(
-            product_url,
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=15,
-        )
+        response = _http_get("nws", product_url, conditional=conditional)
         response.raise_for_status()
         products = response.json().get("@graph", [])
         if not products:
             logging.info("%s check: no products returned.", product_name)
+            _commit_http_validators(product_url)
             return None
 
         latest = products[0]
-        detail_url = latest.get("@id")
-        if not detail_url:
-            return latest
-
-        detail_response = requests.get(
-            detail_url,
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=15,
-        )
-        detail_response.raise_for_status()
-        return detail_response.json()
+        return _fetch_nws_product_detail(latest, product_name)
     except requests.RequestException as e:
         logging.error(f"Error fetching {product_name}: {e}")
     except ValueError as e:
         logging.error(f"Error parsing {product_name}: {e}")
+        _discard_http_validators(product_url)
     return None
 
 
-def _fetch_recent_nws_products(product_url: str, product_name: str, limit: int = 8) -> list[dict]:
+def _nws_product_cache_path(product_id: str) -> str:
+    digest = hashlib.sha256(product_id.encode("utf-8")).hexdigest()
+    return os.path.join(NWS_PRODUCT_CACHE_DIR, f"{digest}.json")
+
+
+def _load_cached_nws_product(product_id: str) -> dict | None:
+    cache_path = _nws_product_cache_path(product_id)
     try:
-        response = requests.get(
-            product_url,
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=15,
-        )
+        with open(cache_path, "r") as file:
+            cached = json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.error(f"Error loading cached NWS product {product_id}: {e}")
+        return None
+    return cached if cached.get("id") == product_id else None
+
+
+def _record_nws_product_cache_result(outcome: str):
+    with _nws_product_cache_stats_lock:
+        _nws_product_cache_stats[outcome] += 1
+
+
+def _load_nws_product_cache_index():
+    """Scan the cache directory once; later stores keep the index current. Caller holds the lock."""
+    global _nws_product_cache_index, _nws_product_cache_bytes
+    entries = []
+    with os.scandir(NWS_PRODUCT_CACHE_DIR) as cache_dir:
+        for entry in cache_dir:
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    _nws_product_cache_index = {path: (mtime, size) for mtime, size, path in sorted(entries)}
+    _nws_product_cache_bytes = sum(size for _, size, _ in entries)
+
+
+def _index_nws_product_cache_entry(path: str):
+    """Record a just-written file, then evict from the oldest end. Caller holds the lock."""
+    global _nws_product_cache_bytes
+    if _nws_product_cache_index is None:
+        _load_nws_product_cache_index()
+    else:
+        stat = os.stat(path)
+        previous = _nws_product_cache_index.pop(path, None)
+        if previous is not None:
+            _nws_product_cache_bytes -= previous[1]
+        _nws_product_cache_index[path] = (stat.st_mtime, stat.st_size)
+        _nws_product_cache_bytes += stat.st_size
+
+    now_epoch = time.time()
+    while _nws_product_cache_index:
+        oldest_path, (mtime, size) = next(iter(_nws_product_cache_index.items()))
+        if oldest_path == path or (
+            now_epoch - mtime <= NWS_PRODUCT_CACHE_MAX_AGE_SECONDS
+            and _nws_product_cache_bytes <= NWS_PRODUCT_CACHE_MAX_BYTES
+        ):
+            break
+        del _nws_product_cache_index[oldest_path]
+        _nws_product_cache_bytes -= size
+        try:
+            os.remove(oldest_path)
+        except FileNotFoundError:
+            pass
+
+
+def _store_cached_nws_product(product_id: str, product: dict):
+    cache_path = _nws_product_cache_path(product_id)
+    temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    try:
+        with _nws_product_cache_lock:
+            os.makedirs(NWS_PRODUCT_CACHE_DIR, exist_ok=True)
+            with open(temp_path, "w") as file:
+                json.dump(product, file)
+            os.replace(temp_path, cache_path)
+            _index_nws_product_cache_entry(cache_path)
+    except OSError as e:
+        logging.error(f"Error caching NWS product {product_id}: {e}")
+
+
+def _fetch_nws_product_detail(product: dict, product_name: str) -> dict | None:
+    """Return full product detail, serving issued products from the local cache.
+
+    NWS products addressed by id never change once issued, so only ids not yet
+    cached cost a network request.
+    """
+    detail_url = product.get("@id")
+    if not detail_url:
+        return product
+
+    product_id = product.get("id")
+    if product_id:
+        cached = _load_cached_nws_product(product_id)
+        if cached:
+            _record_nws_product_cache_result("hits")
+            return cached
+        _record_nws_product_cache_result("misses")
+
+    try:
+        detail_response = _http_get("nws", detail_url)
+        detail_response.raise_for_status()
+        detail = detail_response.json()
+        if product_id and detail.get("id") == product_id:
+            _store_cached_nws_product(product_id, detail)
+        return detail
+    except requests.RequestException as e:
+        logging.error(f"Error fetching {product_name} detail: {e}")
+    except ValueError as e:
+        logging.error(f"Error parsing {product_name} detail: {e}")
+    return None
+
+
+def _fetch_recent_nws_products(
+    product_url: str,
+    product_name: str,
+    limit: int = 8,
+    conditional: bool = False,
+    skip_ids: set | None = None,
+) -> list[dict]:
+    """Fetch the newest products from an NWS list endpoint with full detail.
+
+    Products whose id is in skip_ids are left out before any detail download,
+    and the remaining details are fetched concurrently.
+    """
+    try:
+        response = _http_get("nws", product_url, conditional=conditional)
         response.raise_for_status()
         products = response.json().get("@graph", [])[:limit]
     except requests.RequestException as e:
@@ -1613,27 +2951,26 @@ def _fetch_recent_nws_products(product_url: str, product_name: str, limit: int =
         return []
     except ValueError as e:
         logging.error(f"Error parsing {product_name} list: {e}")
+        _discard_http_validators(product_url)
         return []
 
-    detailed_products = []
-    for product in products:
-        detail_url = product.get("@id")
-        if not detail_url:
-            detailed_products.append(product)
-            continue
-        try:
-            detail_response = requests.get(
-                detail_url,
-                headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-                timeout=15,
-            )
-            detail_response.raise_for_status()
-            detailed_products.append(detail_response.json())
-        except requests.RequestException as e:
-            logging.error(f"Error fetching {product_name} detail: {e}")
-        except ValueError as e:
-            logging.error(f"Error parsing {product_name} detail: {e}")
-    return detailed_products
+    if skip_ids:
+        pending_products = [product for product in products if product.get("id") not in skip_ids]
+        skipped = len(products) - len(pending_products)
+        if skipped:
+            logging.info("%s: skipped %s already processed products.", product_name, skipped)
+        products = pending_products
+    if not products:
+        return []
+
+    worker_count = min(NWS_PRODUCT_DETAIL_WORKERS, len(products))
+    with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="nws-detail") as executor:
+        details = list(executor.map(lambda product: _fetch_nws_product_detail(product, product_name), products))
+    if not all(details):
+        # Keep the old validators so the list is fetched again and the
+        # missing details get another try.
+        _discard_http_validators(product_url)
+    return [detail for detail in details if detail]
 
 
 def _product_is_recent(product: dict, lookback_hours: int) -> bool:
@@ -1648,18 +2985,13 @@ def _product_is_recent(product: dict, lookback_hours: int) -> bool:
 
 
 def _extract_afd_key_messages(product_text: str) -> list[str]:
-    match = re.search(
-        r"\.KEY MESSAGES\.\.\.(.*?)(?:\n&&|\n\.[A-Z][A-Z0-9 /]+\.\.\.)",
-        product_text or "",
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not match:
+    section = NWSTextProduct(product_text).block("sections", "KEY MESSAGES")
+    if section is None:
         return []
 
     messages = []
     current = []
-    for raw_line in match.group(1).splitlines():
-        line = raw_line.strip()
+    for line in section:
         if not line:
             continue
         if line.startswith("-"):
@@ -1688,39 +3020,42 @@ def format_afd_post(product: dict, key_messages: list[str]) -> str:
     return "\n".join(lines)
 
 
-def _peoria_hwo_segment(product_text: str) -> str | None:
-    for segment in re.split(r"\n\$\$\s*\n", product_text or ""):
-        if re.search(r"\bPeoria\b", segment, re.IGNORECASE):
+_PEORIA_WORD = re.compile(r"\bPeoria\b", re.IGNORECASE)
+_HWO_ZONE_LINE = re.compile(r"^(ILZ|[A-Z]{2,}Z|\d{3})")
+HWO_TIMEFRAME_LINES = {
+    "today and tonight",
+    "tonight",
+    "wednesday through monday",
+    "thursday through tuesday",
+    "friday through wednesday",
+    "saturday through thursday",
+    "sunday through friday",
+    "monday through saturday",
+    "tuesday through sunday",
+}
+
+
+def _peoria_hwo_segment(product_text: str) -> NWSTextSegment | None:
+    for segment in NWSTextProduct(product_text).iter_segments():
+        if _PEORIA_WORD.search(segment.text):
             return segment
     return None
 
 
-def _extract_hwo_section(segment: str, heading: str) -> str | None:
-    pattern = rf"\.{re.escape(heading)}\.\.\.(.*?)(?=\n\.[A-Z ]+\.\.\.|\n&&|\n\$\$|\Z)"
-    match = re.search(pattern, segment or "", re.IGNORECASE | re.DOTALL)
-    if not match:
+def _extract_hwo_section(segment: NWSTextSegment, heading: str) -> str | None:
+    section = segment.block("sections", heading)
+    if section is None:
         return None
 
     lines = []
-    for raw_line in match.group(1).splitlines():
-        line = raw_line.strip()
+    for line in section:
         if not line:
             continue
-        if line.lower().rstrip(".") in {
-            "today and tonight",
-            "tonight",
-            "wednesday through monday",
-            "thursday through tuesday",
-            "friday through wednesday",
-            "saturday through thursday",
-            "sunday through friday",
-            "monday through saturday",
-            "tuesday through sunday",
-        }:
+        if line.lower().rstrip(".") in HWO_TIMEFRAME_LINES:
             continue
         if "spotter activation" in line.lower() and "not anticipated" in line.lower():
             return "not anticipated through tonight"
-        if re.match(r"^(ILZ|[A-Z]{2,}Z|\d{3})", line):
+        if _HWO_ZONE_LINE.match(line):
             continue
         lines.append(line)
     text = _collapse_whitespace(" ".join(lines))
@@ -1734,7 +3069,7 @@ def _shorten_sentence(text: str, limit: int = 135) -> str:
     return text[: limit - 3].rstrip(" ,.;") + "..."
 
 
-def format_hwo_post(product: dict, segment: str) -> str | None:
+def format_hwo_post(product: dict, segment: NWSTextSegment) -> str | None:
     day_one = _extract_hwo_section(segment, "DAY ONE")
     days_two = _extract_hwo_section(segment, "DAYS TWO THROUGH SEVEN")
     spotter = _extract_hwo_section(segment, "SPOTTER INFORMATION STATEMENT")
@@ -1791,71 +3126,159 @@ def _lsr_event_is_postworthy(event_name: str) -> bool:
     return any(term in lower_event for term in LSR_POST_EVENT_TERMS)
 
 
-def parse_lsr_reports(product: dict) -> list[dict]:
-    product_text = product.get("productText", "")
-    lines = product_text.splitlines()
-    reports = []
-    current = None
+# Report first line ("0245 PM  Tstm Wnd Dmg  2 N Peoria  40.72N 89.59W") and the date line
+# that normally follows it, found across a whole product in one scan. Everything up to the
+# next report is remarks; blocks with header, $$ or extra date lines take the line-by-line path.
+_LSR_REPORT_LINES = re.compile(
+    r"^(\d{3,4}[ \t]+[AP]M)[ \t]+(.+?)[ \t]{2,}(.+?)[ \t]{2,}([0-9.]+[NS][ \t]+[0-9.]+[EW])[ \t\r]*$"
+    r"(?:\n(\d{2}/\d{2}/\d{4}.*))?",
+    re.MULTILINE,
+)
+_LSR_DATE_LINE = re.compile(r"^\d{2}/\d{2}/\d{4}")
+_LSR_REMARKS_SPECIAL_LINE = re.compile(r"^(?:[ \t]*(?:\.\.|\$\$)|\d{2}/\d{2}/\d{4})", re.MULTILINE)
+LSR_TEXT_COLUMNS = ("time", "location", "latlon", "date", "magnitude", "remarks")
+LSR_CODED_COLUMNS = ("event", "county", "state", "source")
 
-    first_line_pattern = re.compile(
-        r"^(\d{3,4}\s+[AP]M)\s+(.+?)\s{2,}(.+?)\s{2,}([0-9.]+[NS]\s+[0-9.]+[EW])\s*$"
-    )
 
-    def finish_current():
-        if not current:
-            return
-        current["remarks"] = _collapse_whitespace(" ".join(current.get("remarks_lines", []))) or ""
-        current.pop("remarks_lines", None)
-        reports.append(current)
-
-    for raw_line in lines:
-        line = raw_line.rstrip()
-        first_match = first_line_pattern.match(line)
-        if first_match:
-            finish_current()
-            current = {
-                "time": first_match.group(1).strip(),
-                "event": _collapse_whitespace(first_match.group(2)) or "",
-                "location": _collapse_whitespace(first_match.group(3)) or "",
-                "latlon": first_match.group(4).strip(),
-                "remarks_lines": [],
-                "product_id": product.get("id"),
-                "source_url": _product_source_url(product),
-            }
-            continue
+class LSRReportTable:
+    """Reports parsed from a batch of LSR products, stored column by column.
 
-        if not current:
-            continue
+    Event, county, state and source repeat heavily during an outbreak, so those
+    columns are dictionary-encoded: one array of small codes per column plus the
+    list of distinct values. mask() evaluates a filter once per distinct value
+    instead of once per report.
+    """
 
-        if re.match(r"^\d{2}/\d{2}/\d{4}", line):
-            current["date"] = line[0:10].strip()
-            current["magnitude"] = _collapse_whitespace(line[12:24]) or ""
-            current["county"] = _collapse_whitespace(line[29:47]) or ""
-            current["state"] = line[48:50].strip()
-            current["source"] = _collapse_whitespace(line[53:]) or ""
-            continue
+    __slots__ = ("products", "product_rows", "columns", "codes", "values", "_value_codes")
+
+    def __init__(self):
+        self.products = []  # (product id, source URL)
+        self.product_rows = array("H")  # row -> index into products
+        self.columns = {name: [] for name in LSR_TEXT_COLUMNS}
+        self.codes = {name: array("H") for name in LSR_CODED_COLUMNS}
+        self.values = {name: [] for name in LSR_CODED_COLUMNS}
+        self._value_codes = {name: {} for name in LSR_CODED_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.product_rows)
+
+    def add_product(self, product: dict) -> int:
+        self.products.append((product.get("id"), _product_source_url(product)))
+        return len(self.products) - 1
+
+    def append(self, product_number: int, row: tuple):
+        """Add one report; row holds LSR_TEXT_COLUMNS then LSR_CODED_COLUMNS values."""
+        self.product_rows.append(product_number)
+        for column, value in zip(self.columns.values(), row):
+            column.append(value)
+        coded_values = row[len(LSR_TEXT_COLUMNS):]
+        for codes, values, value_codes, value in zip(
+            self.codes.values(), self.values.values(), self._value_codes.values(), coded_values
+        ):
+            code = value_codes.get(value)
+            if code is None:
+                code = value_codes[value] = len(values)
+                values.append(value)
+            codes.append(code)
+
+    def column(self, name: str) -> list:
+        if name in self.codes:
+            values = self.values[name]
+            return [values[code] for code in self.codes[name]]
+        return self.columns[name]
+
+    def value(self, name: str, row: int) -> str:
+        if name in self.codes:
+            return self.values[name][self.codes[name][row]]
+        return self.columns[name][row]
+
+    def mask(self, name: str, predicate) -> list:
+        """predicate(value) for every row of a dictionary-encoded column."""
+        results = [predicate(value) for value in self.values[name]]
+        return [results[code] for code in self.codes[name]]
+
+    def report_keys(self) -> list:
+        """Dedupe key per row: product id, date, time, event, location, county."""
+        product_ids = [str(product_id or "") for product_id, _ in self.products]
+        return [
+            "|".join((product_ids[product_number], date_text, time_text, event, location, county))
+            for product_number, date_text, time_text, event, location, county in zip(
+                self.product_rows,
+                self.columns["date"],
+                self.columns["time"],
+                self.column("event"),
+                self.columns["location"],
+                self.column("county"),
+            )
+        ]
 
-        stripped = line.strip()
-        if stripped and not stripped.startswith("..") and not stripped.startswith("$$"):
-            current["remarks_lines"].append(stripped)
+    def row(self, index: int) -> dict:
+        product_id, source_url = self.products[self.product_rows[index]]
+        report = {name: self.value(name, index) for name in LSR_TEXT_COLUMNS + LSR_CODED_COLUMNS}
+        report["product_id"] = product_id
+        report["source_url"] = source_url
+        return report
 
-    finish_current()
-    return reports
 
+def _lsr_report_row(report_lines: re.Match, block: str) -> tuple:
+    time_text, event, location, latlon, date_line = report_lines.groups()
+    if _LSR_REMARKS_SPECIAL_LINE.search(block) is None:
+        remarks = " ".join(block.split())
+    else:
+        remarks_lines = []
+        for raw_line in block.splitlines():
+            line = raw_line.rstrip()
+            if _LSR_DATE_LINE.match(line):
+                date_line = line
+                continue
+            stripped = line.strip()
+            if stripped and not stripped.startswith("..") and not stripped.startswith("$$"):
+                remarks_lines.append(stripped)
+        remarks = _collapse_whitespace(" ".join(remarks_lines)) or ""
+    date_line = (date_line or "").rstrip()
+    return (
+        time_text.strip(),
+        _collapse_whitespace(location) or "",
+        latlon.strip(),
+        date_line[0:10].strip(),
+        _collapse_whitespace(date_line[12:24]) or "",
+        remarks,
+        _collapse_whitespace(event) or "",
+        _collapse_whitespace(date_line[29:47]) or "",
+        date_line[48:50].strip(),
+        _collapse_whitespace(date_line[53:]) or "",
+    )
 
-def _lsr_report_is_local(report: dict) -> bool:
-    return report.get("county") in LSR_LOCAL_COUNTIES
 
+def parse_lsr_products(products: list) -> LSRReportTable:
+    """Parse every report in a batch of LSR products into one table."""
+    table = LSRReportTable()
+    for product in products:
+        product_number = table.add_product(product)
+        text = product.get("productText") or ""
+        previous = None
+        for report_lines in _LSR_REPORT_LINES.finditer(text):
+            if previous is not None:
+                table.append(product_number, _lsr_report_row(previous, text[previous.end():report_lines.start()]))
+            previous = report_lines
+        if previous is not None:
+            table.append(product_number, _lsr_report_row(previous, text[previous.end():]))
+    return table
+
+
+def parse_lsr_reports(product: dict) -> list[dict]:
+    table = parse_lsr_products([product])
+    return [table.row(index) for index in range(len(table))]
 
-def _lsr_report_key(report: dict) -> str:
-    return "|".join([
-        str(report.get("product_id") or ""),
-        str(report.get("date") or ""),
-        str(report.get("time") or ""),
-        str(report.get("event") or ""),
-        str(report.get("location") or ""),
-        str(report.get("county") or ""),
-    ])
+
+def _lsr_county_is_local(county: str) -> bool:
+    return county in LSR_LOCAL_COUNTIES
+
+
+def _lsr_report_priority(report: dict) -> int:
+    if "tornado" in (report.get("event") or "").lower():
+        return POST_PRIORITY_URGENT
+    return POST_PRIORITY_HIGH
 
 
 def format_lsr_post(report: dict) -> str:
@@ -1907,13 +3330,9 @@ def _extract_official_image_url(raw_text: str) -> str | None:
     return match.group(0) if match else None
 
 
-def fetch_spc_md_items() -> list[dict]:
+def fetch_spc_md_items(conditional: bool = False) -> list[dict]:
     try:
-        response = requests.get(
-            SPC_RSS_URL,
-            headers={"User-Agent": "PeoriaWeatherBot/1.0"},
-            timeout=15,
-        )
+        response = _http_get("spc", SPC_RSS_URL, conditional=conditional)
         response.raise_for_status()
         root = ET.fromstring(response.content)
     except requests.RequestException as e:
@@ -1921,6 +3340,7 @@ def fetch_spc_md_items() -> list[dict]:
         return []
     except ET.ParseError as e:
         logging.error(f"Error parsing SPC RSS: {e}")
+        _discard_http_validators(SPC_RSS_URL)
         return []
 
     items = []
@@ -1951,19 +3371,18 @@ def _spc_md_is_local(item: dict) -> bool:
     return any(term.lower() in searchable.lower() for term in SPC_MD_LOCAL_TERMS)
 
 
-def _extract_spc_line(text: str, label: str) -> str | None:
-    pattern = rf"{re.escape(label)}\.\.\.(.*?)(?=\n[A-Z][A-Za-z /]+\.\.\.|\n\n|\Z)"
-    match = re.search(pattern, text or "", re.IGNORECASE | re.DOTALL)
-    if not match:
+def _extract_spc_line(product: NWSTextProduct, label: str) -> str | None:
+    block = product.block("labels", label)
+    if block is None:
         return None
-    return _shorten_sentence(match.group(1), 145)
+    return _shorten_sentence(" ".join(block), 145)
 
 
 def format_spc_md_post(item: dict) -> str:
-    text = item.get("text", "")
-    concerning = _extract_spc_line(text, "Concerning")
-    watch_probability = _extract_spc_line(text, "Probability of Watch Issuance")
-    summary = _extract_spc_line(text, "SUMMARY")
+    product = NWSTextProduct(item.get("text", ""), labels=True)
+    concerning = _extract_spc_line(product, "Concerning")
+    watch_probability = _extract_spc_line(product, "Probability of Watch Issuance")
+    summary = _extract_spc_line(product, "SUMMARY")
 
     lines = [
         "🌪️ SPC mesoscale discussion may include central Illinois.",
@@ -1992,9 +3411,14 @@ def check_forecast_products(force: bool = False):
         return
     _last_forecast_product_check_epoch = now_epoch
 
-    history = _cleanup_forecast_product_history(_load_forecast_product_history())
+    history = _forecast_product_history
+    history.expire(FORECAST_PRODUCT_HISTORY_TTL_SECONDS)
 
-    hwo = _fetch_latest_nws_product(NWS_HWO_URL, "NWS HWO")
+    try:
+        hwo = _fetch_latest_nws_product(NWS_HWO_URL, "NWS HWO", conditional=not force)
+    except HTTPNotModified:
+        logging.info("NWS HWO: product list unchanged since last check.")
+        hwo = None
     if hwo:
         hwo_key = f"HWO|{hwo.get('id')}"
         segment = _peoria_hwo_segment(hwo.get("productText", ""))
@@ -2004,16 +3428,20 @@ def check_forecast_products(force: bool = False):
         elif not segment:
             logging.info("NWS HWO: no Peoria segment found.")
             history[hwo_key] = now_epoch
-        elif not _has_notable_product_terms(segment):
+        elif not _has_notable_product_terms(segment.text):
             logging.info("NWS HWO: Peoria segment had no notable hazard terms.")
             history[hwo_key] = now_epoch
         elif message:
             logging.info("NWS HWO: posting Peoria outlook summary.")
-            post_to_bluesky(message)
-            send_telegram_message(message)
+            enqueue_post(message, label="NWS HWO", priority=POST_PRIORITY_NORMAL)
             history[hwo_key] = now_epoch
+        _commit_http_validators(NWS_HWO_URL)
 
-    afd = _fetch_latest_nws_product(NWS_AFD_URL, "NWS AFD")
+    try:
+        afd = _fetch_latest_nws_product(NWS_AFD_URL, "NWS AFD", conditional=not force)
+    except HTTPNotModified:
+        logging.info("NWS AFD: product list unchanged since last check.")
+        afd = None
     if afd:
         afd_key = f"AFD|{afd.get('id')}"
         key_messages = _extract_afd_key_messages(afd.get("productText", ""))
@@ -2029,11 +3457,17 @@ def check_forecast_products(force: bool = False):
         else:
             logging.info("NWS AFD: posting key messages summary.")
             afd_message = format_afd_post(afd, key_messages)
-            post_to_bluesky(afd_message)
-            send_telegram_message(afd_message)
+            enqueue_post(afd_message, label="NWS AFD", priority=POST_PRIORITY_LOW)
             history[afd_key] = now_epoch
+        _commit_http_validators(NWS_AFD_URL)
+
+    try:
+        spc_md_items = fetch_spc_md_items(conditional=not force)
+    except HTTPNotModified:
+        logging.info("SPC MD: RSS feed unchanged since last check.")
+        spc_md_items = []
 
-    for item in fetch_spc_md_items():
+    for item in spc_md_items:
         md_key = f"SPCMD|{item.get('guid')}"
         if md_key in history:
             continue
@@ -2044,57 +3478,81 @@ def check_forecast_products(force: bool = False):
 
         logging.info("SPC MD: posting local mesoscale discussion: %s", item.get("title"))
         md_message = format_spc_md_post(item)
-        post_to_bluesky_with_official_image(
+        enqueue_post(
             md_message,
-            item.get("image_url"),
-            f"Official SPC mesoscale discussion graphic for {item.get('title', 'a mesoscale discussion')}.",
+            image_url=item.get("image_url"),
+            alt_text=f"Official SPC mesoscale discussion graphic for {item.get('title', 'a mesoscale discussion')}.",
+            label="SPC MD",
+            priority=POST_PRIORITY_HIGH,
         )
-        send_telegram_photo(md_message, item.get("image_url"))
         history[md_key] = now_epoch
+    _commit_http_validators(SPC_RSS_URL)
 
-    recent_lsr_products = _fetch_recent_nws_products(NWS_LSR_URL, "NWS LSR", limit=10)
-    lsr_reports_checked = 0
-    lsr_reports_posted = 0
+    try:
+        recent_lsr_products = _fetch_recent_nws_products(
+            NWS_LSR_URL,
+            "NWS LSR",
+            limit=10,
+            conditional=not force,
+            skip_ids=_processed_lsr_product_ids(history),
+        )
+    except HTTPNotModified:
+        logging.info("NWS LSR: product list unchanged since last check.")
+        recent_lsr_products = []
+    lsr_products = []
     for product in recent_lsr_products:
-        if not _product_is_recent(product, LSR_LOOKBACK_HOURS):
+        if _product_is_recent(product, LSR_LOOKBACK_HOURS):
+            lsr_products.append(product)
+        elif product.get("id"):
+            history[f"LSRPRODUCT|{product['id']}"] = now_epoch
+
+    # All recent products parse into one table; the county and event filters run
+    # once per distinct value rather than once per report.
+    lsr_table = parse_lsr_products(lsr_products)
+    lsr_is_local = lsr_table.mask("county", _lsr_county_is_local)
+    lsr_is_postworthy = lsr_table.mask("event", _lsr_event_is_postworthy)
+    lsr_reports_checked = len(lsr_table)
+    lsr_reports_posted = 0
+    for index, report_key in enumerate(lsr_table.report_keys()):
+        lsr_key = f"LSR|{report_key}"
+        if lsr_key in history:
             continue
-        for report in parse_lsr_reports(product):
-            lsr_reports_checked += 1
-            lsr_key = f"LSR|{_lsr_report_key(report)}"
-            if lsr_key in history:
-                continue
-            if not _lsr_report_is_local(report):
-                logging.info(
-                    "NWS LSR skipped outside local counties: %s in %s County.",
-                    report.get("event", "unknown"),
-                    report.get("county", "unknown"),
-                )
-                history[lsr_key] = now_epoch
-                continue
-            if not _lsr_event_is_postworthy(report.get("event", "")):
-                logging.info("NWS LSR skipped low-priority event: %s.", report.get("event", "unknown"))
-                history[lsr_key] = now_epoch
-                continue
-
+        if not lsr_is_local[index]:
             logging.info(
-                "NWS LSR: posting %s near %s, %s County.",
-                report.get("event", "unknown"),
-                report.get("location", "unknown"),
-                report.get("county", "unknown"),
+                "NWS LSR skipped outside local counties: %s in %s County.",
+                lsr_table.value("event", index) or "unknown",
+                lsr_table.value("county", index) or "unknown",
             )
-            lsr_message = format_lsr_post(report)
-            post_to_bluesky(lsr_message)
-            send_telegram_message(lsr_message)
             history[lsr_key] = now_epoch
-            lsr_reports_posted += 1
+            continue
+        if not lsr_is_postworthy[index]:
+            logging.info("NWS LSR skipped low-priority event: %s.", lsr_table.value("event", index) or "unknown")
+            history[lsr_key] = now_epoch
+            continue
+
+        report = lsr_table.row(index)
+        logging.info(
+            "NWS LSR: posting %s near %s, %s County.",
+            report["event"] or "unknown",
+            report["location"] or "unknown",
+            report["county"] or "unknown",
+        )
+        lsr_message = format_lsr_post(report)
+        enqueue_post(lsr_message, label="NWS LSR", priority=_lsr_report_priority(report))
+        history[lsr_key] = now_epoch
+        lsr_reports_posted += 1
+
+    # LSR products never change after issuance, so each one is parsed once.
+    for product in lsr_products:
+        if product.get("id"):
+            history[f"LSRPRODUCT|{product['id']}"] = now_epoch
+    _commit_http_validators(NWS_LSR_URL)
 
     if recent_lsr_products and not lsr_reports_checked:
         logging.info("NWS LSR: no recent reports inside the %s-hour window.", LSR_LOOKBACK_HOURS)
     elif lsr_reports_checked and not lsr_reports_posted:
         logging.info("NWS LSR: checked %s recent reports with no new local posts.", lsr_reports_checked)
 
-    _save_forecast_product_history(history)
-
 
 def _safe_float(value):
     try:
@@ -2115,13 +3573,16 @@ def _extract_pressure_inhg(data) -> float | None:
     return None
 
 
-def _update_pressure_history(observed_at: datetime, pressure_inhg: float | None):
-    global _pressure_history
+def _update_pressure_history(station: StationState, observed_epoch: float, pressure_inhg: float | None):
     if pressure_inhg is None:
         return
-    now_epoch = observed_at.timestamp()
-    _pressure_history.append((now_epoch, pressure_inhg))
-    _pressure_history = [(t, p) for (t, p) in _pressure_history if (now_epoch - t) <= 6 * 3600]
+    station.pressure_history.append(observed_epoch, pressure_inhg)
+
+
+def _station_observation_epoch(data, fallback_epoch: float) -> float:
+    """The station's own observation time, or fallback_epoch when it is missing."""
+    epoch = _safe_float(data.get("timestamp"))
+    return epoch if epoch is not None and epoch > 0 else fallback_epoch
 
 
 def _compute_dew_point_f(temp_f: float, humidity: float) -> float | None:
@@ -2133,6 +3594,34 @@ def _compute_dew_point_f(temp_f: float, humidity: float) -> float | None:
     return dew_point_c * 9 / 5 + 32
 
 
+def _compute_feels_like_c(temp_c: float, humidity: float | None, wind_mps: float | None) -> float:
+    """NWS wind chill at or below 50°F, heat index at or above 80°F, otherwise the air temperature.
+
+    The REST API reports feels_like; raw obs_st messages do not.
+    """
+    temp_f = temp_c * 9 / 5 + 32
+    wind_mph = (wind_mps or 0) * 2.23694
+    if temp_f <= 50 and wind_mph > 3:
+        wind_term = wind_mph ** 0.16
+        feels_f = 35.74 + 0.6215 * temp_f - 35.75 * wind_term + 0.4275 * temp_f * wind_term
+    elif temp_f >= 80 and humidity:
+        rh = humidity
+        feels_f = 0.5 * (temp_f + 61.0 + (temp_f - 68.0) * 1.2 + rh * 0.094)
+        if (feels_f + temp_f) / 2 >= 80:
+            feels_f = (
+                -42.379 + 2.04901523 * temp_f + 10.14333127 * rh - 0.22475541 * temp_f * rh
+                - 0.00683783 * temp_f * temp_f - 0.05481717 * rh * rh + 0.00122874 * temp_f * temp_f * rh
+                + 0.00085282 * temp_f * rh * rh - 0.00000199 * temp_f * temp_f * rh * rh
+            )
+            if rh < 13 and 80 <= temp_f <= 112:
+                feels_f -= ((13 - rh) / 4) * math.sqrt((17 - abs(temp_f - 95)) / 17)
+            elif rh > 85 and 80 <= temp_f <= 87:
+                feels_f += ((rh - 85) / 10) * ((87 - temp_f) / 5)
+    else:
+        return temp_c
+    return (feels_f - 32) * 5 / 9
+
+
 def _dew_point_phrase(dew_point_f: float) -> str:
     if dew_point_f <= 35:
         return "dry air"
@@ -2162,16 +3651,16 @@ def _pressure_trend_line(snapshot: dict) -> str | None:
     if pressure_inhg is None:
         return None
 
-    if len(_pressure_history) < 2:
+    pressure_history = _station_state(snapshot.get("station_id")).pressure_history
+    if len(pressure_history) < 2:
         return f"Pressure {pressure_inhg:.2f} inHg"
 
     now_epoch = snapshot["observed_at"].timestamp()
-    target = now_epoch - 3 * 3600
-    candidates = [(t, pressure) for (t, pressure) in _pressure_history if t <= target]
-    if not candidates:
+    previous = pressure_history.latest_at_or_before(now_epoch - 3 * 3600)
+    if previous is None:
         return f"Pressure {pressure_inhg:.2f} inHg"
 
-    _, previous_pressure = min(candidates, key=lambda item: abs(item[0] - target))
+    _, previous_pressure = previous
     delta = pressure_inhg - previous_pressure
 
     if delta <= -0.08 and snapshot["headline_condition"] in {"stormy", "rainy", "light rain"}:
@@ -2183,22 +3672,7 @@ def _pressure_trend_line(snapshot: dict) -> str | None:
     return f"Pressure {pressure_inhg:.2f} inHg"
 
 
-def _load_river_history() -> dict:
-    if os.path.exists(RIVER_HISTORY_FILE):
-        try:
-            with open(RIVER_HISTORY_FILE, "r") as file:
-                return json.load(file)
-        except Exception as e:
-            logging.error(f"Error loading river history: {e}")
-    return {}
-
-
-def _save_river_history(history: dict):
-    try:
-        with open(RIVER_HISTORY_FILE, "w") as file:
-            json.dump(history, file)
-    except Exception as e:
-        logging.error(f"Error saving river history: {e}")
+_river_history = StateTable("river_history")
 
 
 def _river_category_rank(category: str | None) -> int:
@@ -2247,16 +3721,21 @@ def _nearest_river_impact(gauge: dict, stage_ft: float | None) -> str | None:
     return chosen.get("statement")
 
 
-def fetch_river_gauge(gauge_id: str):
-    url = f"https://api.water.noaa.gov/nwps/v1/gauges/{gauge_id}"
+def _river_gauge_url(gauge_id: str) -> str:
+    return f"https://api.water.noaa.gov/nwps/v1/gauges/{gauge_id}"
+
+
+def fetch_river_gauge(gauge_id: str, conditional: bool = False):
+    url = _river_gauge_url(gauge_id)
     try:
-        response = requests.get(url, timeout=15)
+        response = _http_get("nwps", url, conditional=conditional)
         response.raise_for_status()
         gauge = response.json()
         gauge["_configured_gauge_id"] = gauge_id
         return gauge
     except requests.RequestException as e:
         logging.error(f"Error fetching river gauge data for {gauge_id}: {e}")
+        _discard_http_validators(url)
         return None
 
 
@@ -2298,6 +3777,17 @@ def format_river_status_post(gauge: dict) -> str:
     return "\n".join(lines)
 
 
+def _river_keepalive_due(gauge_history: dict, now_epoch: float) -> bool:
+    last_posted_epoch = _safe_float(gauge_history.get("last_posted_epoch"))
+    if not last_posted_epoch:
+        return False
+    highest_rank = max(
+        _river_category_rank(gauge_history.get("observed_category")),
+        _river_category_rank(gauge_history.get("forecast_category")),
+    )
+    return highest_rank >= 1 and (now_epoch - last_posted_epoch) >= RIVER_POST_KEEPALIVE_SECONDS
+
+
 def check_river_flood_status(force: bool = False):
     global _last_river_check_epoch
 
@@ -2306,11 +3796,15 @@ def check_river_flood_status(force: bool = False):
         return
     _last_river_check_epoch = now_epoch
 
-    history = _load_river_history()
-    gauge_histories = history.setdefault("gauges", {})
+    gauge_histories = _river_history
 
     for gauge_id, gauge_name in RIVER_GAUGES.items():
-        gauge = fetch_river_gauge(gauge_id)
+        conditional = not force and not _river_keepalive_due(gauge_histories.get(gauge_id) or {}, now_epoch)
+        try:
+            gauge = fetch_river_gauge(gauge_id, conditional=conditional)
+        except HTTPNotModified:
+            logging.info("River check %s: gauge data unchanged since last check.", gauge_id)
+            continue
         if not gauge:
             continue
 
@@ -2324,18 +3818,8 @@ def check_river_flood_status(force: bool = False):
         forecast_stage_text = f"{forecast_stage:.1f} ft" if forecast_stage is not None else "unknown stage"
 
         highest_rank = max(_river_category_rank(observed_category), _river_category_rank(forecast_category))
-        gauge_history = gauge_histories.setdefault(gauge_id, {})
-        if gauge_id == "PIAI2" and history.get("observed_category") and not gauge_history:
-            for key in (
-                "last_posted_epoch",
-                "observed_category",
-                "forecast_category",
-                "observed_stage",
-                "forecast_stage",
-                "last_checked_epoch",
-            ):
-                if key in history:
-                    gauge_history[key] = history[key]
+        # Work on a copy; the stored row only changes through the table, under its lock.
+        gauge_history = dict(gauge_histories.get(gauge_id) or {})
 
         should_post = False
         if highest_rank >= 1:
@@ -2384,8 +3868,7 @@ def check_river_flood_status(force: bool = False):
                 forecast_stage_text,
             )
             river_message = format_river_status_post(gauge)
-            post_to_bluesky(river_message)
-            send_telegram_message(river_message)
+            enqueue_post(river_message, label=f"river {gauge_id}", priority=POST_PRIORITY_NORMAL)
             gauge_history["last_posted_epoch"] = now_epoch
         elif should_post:
             logging.warning("River check %s: update triggered but observed stage is unavailable.", gauge_id)
@@ -2398,8 +3881,8 @@ def check_river_flood_status(force: bool = False):
             "forecast_stage": forecast_stage,
             "last_checked_epoch": now_epoch,
         })
-
-    _save_river_history(history)
+        gauge_histories[gauge_id] = gauge_history
+        _commit_http_validators(_river_gauge_url(gauge_id))
 
 
 def _is_quiet_hours(now: datetime | None = None) -> bool:
@@ -2561,17 +4044,16 @@ def _build_wind_line(snapshot: dict) -> str:
     return wind_line
 
 
-def _temperature_trend_line(current_temp_f: float) -> str | None:
-    if len(_temp_history) < 2:
+def _temperature_trend_line(current_temp_f: float, station: StationState) -> str | None:
+    if len(station.temp_history) < 2:
         return None
 
     now_epoch = time.time()
-    target = now_epoch - 30 * 60
-    candidates = [(t, temp) for (t, temp) in _temp_history if t <= target]
-    if not candidates:
+    previous = station.temp_history.latest_at_or_before(now_epoch - 30 * 60)
+    if previous is None:
         return None
 
-    prev_t, prev_temp = min(candidates, key=lambda x: abs(x[0] - target))
+    prev_t, prev_temp = previous
     delta = current_temp_f - prev_temp
 
     if delta <= -5:
@@ -2622,51 +4104,42 @@ def _should_include_hashtag(
     ])
 
 
-def _update_daily_stats(current_temp_f: float, rain_in_day: float):
+def _update_daily_stats(station: StationState, current_temp_f: float, rain_in_day: float):
     """Track daily high/low temperature and daily rain total for the summary."""
-    global _daily_high_temp_f, _daily_low_temp_f, _daily_rain_total_in
-
-    if _daily_high_temp_f is None or current_temp_f > _daily_high_temp_f:
-        _daily_high_temp_f = current_temp_f
-    if _daily_low_temp_f is None or current_temp_f < _daily_low_temp_f:
-        _daily_low_temp_f = current_temp_f
+    if station.daily_high_temp_f is None or current_temp_f > station.daily_high_temp_f:
+        station.daily_high_temp_f = current_temp_f
+    if station.daily_low_temp_f is None or current_temp_f < station.daily_low_temp_f:
+        station.daily_low_temp_f = current_temp_f
 
     # WeatherFlow provides daily accumulation; keep the latest observed value.
     if rain_in_day is not None:
-        _daily_rain_total_in = float(rain_in_day)
+        station.daily_rain_total_in = float(rain_in_day)
 
 
-def check_rapid_changes(current_temp_f: float) -> str | None:
+def check_rapid_changes(current_temp_f: float, station: StationState) -> str | None:
     """Detect rapid temperature drops (>= 10°F over ~1 hour) with 3-hour cooldown.
 
-    Uses in-memory history; restarts reset history.
+    History is replayed from the observation log at startup, so restarts keep it.
     """
-    global _temp_history, _last_rapid_alert_epoch
-
     now_epoch = time.time()
 
+    # Record and keep ~2 hours of history, even while cooling down
+    station.temp_history.append(now_epoch, current_temp_f)
+
     # Cooldown: 3 hours
-    if _last_rapid_alert_epoch and (now_epoch - _last_rapid_alert_epoch) < 3 * 3600:
-        # Still record history even if cooling down
-        _temp_history.append((now_epoch, current_temp_f))
-        _temp_history = [(t, temp) for (t, temp) in _temp_history if (now_epoch - t) <= 2 * 3600]
+    if station.last_rapid_alert_epoch and (now_epoch - station.last_rapid_alert_epoch) < 3 * 3600:
         return None
 
-    # Record and keep ~2 hours of history
-    _temp_history.append((now_epoch, current_temp_f))
-    _temp_history = [(t, temp) for (t, temp) in _temp_history if (now_epoch - t) <= 2 * 3600]
-
-    target = now_epoch - 3600
-    # Find the reading closest to ~1 hour ago, but only from readings at or before the target time
-    candidates = [(t, temp) for (t, temp) in _temp_history if t <= target]
-    if not candidates:
+    # The reading closest to ~1 hour ago, from readings at or before the target time
+    previous = station.temp_history.latest_at_or_before(now_epoch - 3600)
+    if previous is None:
         return None
 
-    prev_t, prev_temp = min(candidates, key=lambda x: abs(x[0] - target))
+    prev_t, prev_temp = previous
     drop = prev_temp - current_temp_f
 
     if drop >= 10.0:
-        _last_rapid_alert_epoch = now_epoch
+        station.last_rapid_alert_epoch = now_epoch
         prev_time = _friendly_time(datetime.fromtimestamp(prev_t))
         now_time = _friendly_time()
         return (
@@ -2680,18 +4153,17 @@ def check_rapid_changes(current_temp_f: float) -> str | None:
 
 def send_daily_summary():
     """Post an end-of-day summary at 23:59."""
-    global _daily_high_temp_f, _daily_low_temp_f, _daily_rain_total_in
-
+    station = _station_state()
     date_str = datetime.now().strftime("%Y-%m-%d")
 
-    hi = _daily_high_temp_f
-    lo = _daily_low_temp_f
-    rain = _daily_rain_total_in
+    hi = station.daily_high_temp_f
+    lo = station.daily_low_temp_f
+    rain = station.daily_rain_total_in
 
     # Fallbacks in case we have limited data
     hi_str = f"{hi:.1f}°F" if hi is not None else "N/A"
     lo_str = f"{lo:.1f}°F" if lo is not None else "N/A"
-    narrative = _daily_summary_narrative(hi, rain, daily_max_wind_gust)
+    narrative = _daily_summary_narrative(hi, rain, station.daily_max_wind_gust)
 
     if hi is not None and lo is not None:
         summary_message = (
@@ -2699,7 +4171,7 @@ def send_daily_summary():
             f"{narrative}\n"
             f"High {round(hi)}°F, low {round(lo)}°F\n"
             f"Rain: {rain:.2f}\"\n"
-            f"Peak wind: {round(daily_max_wind_avg)} mph, gusting to {round(daily_max_wind_gust)}\n"
+            f"Peak wind: {round(station.daily_max_wind_avg)} mph, gusting to {round(station.daily_max_wind_gust)}\n"
             f"#peoriaweather"
         )
     else:
@@ -2708,48 +4180,438 @@ def send_daily_summary():
             f"{narrative}\n"
             f"High/low: {hi_str} / {lo_str}\n"
             f"Rain: {rain:.2f}\"\n"
-            f"Peak wind: {round(daily_max_wind_avg)} mph, gusting to {round(daily_max_wind_gust)}\n"
+            f"Peak wind: {round(station.daily_max_wind_avg)} mph, gusting to {round(station.daily_max_wind_gust)}\n"
             f"#peoriaweather"
         )
 
-    # post_to_mastodon(summary_message)
-    post_to_bluesky(summary_message)
-    send_telegram_message(summary_message)
-    # post_tweet(summary_message)
+    enqueue_post(summary_message, label="daily summary", priority=POST_PRIORITY_LOW)
+
+
+# Append-only log of station observations, replayed into the rolling windows at startup.
+OBSERVATION_LOG_DIR = "observation_log"
+OBSERVATION_LOG_SEGMENT_BYTES = 256 * 1024
+OBSERVATION_LOG_MAX_SEGMENTS = 4
+# fetched epoch, station epoch, temp °F, pressure inHg, wind mph, gust mph (NaN when missing)
+OBSERVATION_RECORD = struct.Struct("<ddffff")
+_observation_log_lock = threading.Lock()
+
+
+def _observation_log_dir(station_id: str) -> str:
+    return os.path.join(OBSERVATION_LOG_DIR, station_id or "default")
+
+
+def _observation_log_segments(station_id: str) -> list:
+    log_dir = _observation_log_dir(station_id)
+    try:
+        names = sorted(
+            name for name in os.listdir(log_dir)
+            if name.startswith("obs-") and name.endswith(".log")
+        )
+    except FileNotFoundError:
+        return []
+    return [os.path.join(log_dir, name) for name in names]
+
+
+def _observation_float(value, scale: float = 1.0) -> float:
+    try:
+        return float(value) * scale
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _append_observation_log(station_id: str, obs: dict):
+    temp_c = _observation_float(obs.get("air_temperature"))
+    pressure_inhg = _extract_pressure_inhg(obs)
+    record = OBSERVATION_RECORD.pack(
+        time.time(),
+        _observation_float(obs.get("timestamp")),
+        temp_c * 9 / 5 + 32,
+        math.nan if pressure_inhg is None else pressure_inhg,
+        _observation_float(obs.get("wind_avg"), 2.23694),
+        _observation_float(obs.get("wind_gust"), 2.23694),
+    )
+
+    log_dir = _observation_log_dir(station_id)
+    with _observation_log_lock:
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+            segments = _observation_log_segments(station_id)
+            if segments and os.path.getsize(segments[-1]) + len(record) <= OBSERVATION_LOG_SEGMENT_BYTES:
+                path = segments[-1]
+            else:
+                path = os.path.join(log_dir, f"obs-{time.time_ns():020d}.log")
+                segments.append(path)
+                for stale_path in segments[:-OBSERVATION_LOG_MAX_SEGMENTS]:
+                    os.remove(stale_path)
+            with open(path, "ab") as file:
+                file.write(record)
+        except OSError as e:
+            logging.error(f"Error appending to observation log: {e}")
+
+
+def _replay_station_observation_log(station: StationState) -> int:
+    cutoff = time.time() - max(station.temp_history.max_age_seconds, station.pressure_history.max_age_seconds)
+    replayed = 0
+    for path in _observation_log_segments(station.station_id):
+        try:
+            with open(path, "r+b") as file:
+                size = os.fstat(file.fileno()).st_size
+                usable = size - size % OBSERVATION_RECORD.size
+                if usable != size:
+                    # A crash mid-append leaves a partial record; drop it so later appends stay aligned.
+                    logging.warning("Observation log %s: dropping %s trailing bytes.", path, size - usable)
+                    file.truncate(usable)
+                if not usable:
+                    continue
+                with mmap.mmap(file.fileno(), usable, access=mmap.ACCESS_READ) as mapped:
+                    for fetched_epoch, station_epoch, temp_f, pressure_inhg, _, _ in OBSERVATION_RECORD.iter_unpack(
+                        mapped
+                    ):
+                        if fetched_epoch < cutoff:
+                            continue
+                        if not math.isnan(temp_f):
+                            station.temp_history.append(fetched_epoch, temp_f)
+                        if not math.isnan(pressure_inhg):
+                            # Pressure is keyed by station time, as in _build_weather_snapshot.
+                            station.pressure_history.append(
+                                station_epoch if station_epoch > 0 else fetched_epoch,
+                                pressure_inhg,
+                            )
+                        replayed += 1
+        except (OSError, ValueError) as e:
+            logging.error(f"Error replaying observation log {path}: {e}")
+    return replayed
+
+
+def replay_observation_log():
+    """Rebuild each station's temperature and pressure windows from its observation log."""
+    started = time.perf_counter()
+    replayed = sum(_replay_station_observation_log(station) for station in _station_states.values())
+    logging.info(
+        "Replayed %s recent observations from %s in %.1f ms.",
+        replayed,
+        OBSERVATION_LOG_DIR,
+        (time.perf_counter() - started) * 1000,
+    )
+
+
+# Real-time ingest: the hub's local UDP broadcast (or a recorded replay of it) keeps the
+# primary station's latest observation and lightning strikes in memory. REST polling stays
+# the fallback whenever the stream has gone quiet.
+WEATHERFLOW_INGEST_MODE = os.getenv("WEATHERFLOW_INGEST_MODE", "rest").strip().lower()  # rest, udp or replay
+WEATHERFLOW_UDP_PORT = _env_int("WEATHERFLOW_UDP_PORT", 50222)
+WEATHERFLOW_UDP_SERIAL = os.getenv("WEATHERFLOW_UDP_SERIAL", "").strip()  # Optional: only accept this device
+WEATHERFLOW_REPLAY_FILE = os.getenv("WEATHERFLOW_REPLAY_FILE", "weatherflow_replay.jsonl")
+WEATHERFLOW_REPLAY_DELAY_MS = _env_int("WEATHERFLOW_REPLAY_DELAY_MS", 1000)
+WEATHERFLOW_STREAM_STALE_SECONDS = 3 * 60
+STORM_FOLLOW_UP_STREAM_INTERVAL = 30
+
+
+class WeatherFlowStream:
+    """Live primary-station observation built from WeatherFlow UDP messages.
+
+    obs_st reports arrive once a minute and evt_strike as each strike is
+    detected. The fields only the REST API provides (feels-like, last-hour and
+    local-day rain, 3-hour strike count, last strike) are rebuilt from the
+    message history, so observation() can go straight into _build_weather_snapshot.
+    """
+
+    def __init__(self, on_event=None):
+        self.on_event = on_event
+        self.metrics = {"messages": 0, "observations": 0, "strikes": 0, "ignored": 0, "errors": 0}
+        self._latest = None
+        self._received_at = None
+        self._rain_minutes = deque()  # (epoch, mm) over the last hour
+        self._rain_date = None
+        self._rain_day_mm = 0.0
+        self._seeded_through = 0  # REST seed already counts rain up to this station epoch
+        self._strikes = deque()  # (epoch, count, distance km) over the last 3 hours
+        self._strikes_since_obs = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self, mode: str):
+        target = self._replay_file if mode == "replay" else self._listen_udp
+        self._thread = threading.Thread(target=target, name="weatherflow-stream", daemon=True)
+        self._thread.start()
+
+    def seed(self, obs: dict | None):
+        """Carry the REST rain totals into the stream so a restart doesn't zero them.
+
+        The last-hour total is spread evenly over the hour before the REST
+        observation, so it ages out minute by minute instead of all at once.
+        """
+        if not obs:
+            return
+        epoch = _safe_float(obs.get("timestamp"))
+        if not epoch:
+            return
+        with self._lock:
+            if self._latest is not None:
+                return
+            self._rain_date = datetime.fromtimestamp(epoch).strftime("%Y-%m-%d")
+            self._rain_day_mm = _safe_float(obs.get("precip_accum_local_day")) or 0.0
+            hour_mm = _safe_float(obs.get("precip_accum_last_1hr")) or 0.0
+            if hour_mm > 0:
+                self._rain_minutes.extend((epoch - 60 * minute, hour_mm / 60) for minute in range(59, -1, -1))
+            self._seeded_through = epoch
+
+    def _listen_udp(self):
+        self.seed(_fetch_rest_observation(PRIMARY_STATION_ID))
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("", WEATHERFLOW_UDP_PORT))
+        except OSError as e:
+            logging.error(f"WeatherFlow stream: could not listen on UDP port {WEATHERFLOW_UDP_PORT}: {e}")
+            return
+        logging.info("WeatherFlow stream: listening on UDP port %s.", WEATHERFLOW_UDP_PORT)
+        while True:
+            try:
+                payload, _ = sock.recvfrom(4096)
+            except OSError as e:
+                logging.error(f"WeatherFlow stream: UDP receive failed: {e}")
+                time.sleep(1)
+                continue
+            self.receive(payload)
+
+    def _replay_file(self):
+        logging.info("WeatherFlow stream: replaying %s.", WEATHERFLOW_REPLAY_FILE)
+        try:
+            with open(WEATHERFLOW_REPLAY_FILE, encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        self.receive(line)
+                        time.sleep(WEATHERFLOW_REPLAY_DELAY_MS / 1000)
+        except OSError as e:
+            logging.error(f"WeatherFlow stream: could not read replay file: {e}")
+            return
+        logging.info("WeatherFlow stream: replay finished (%s).", self.summary())
+
+    def receive(self, payload: bytes | str):
+        """Decode one UDP datagram (or replay line) and notify on_event if it mattered."""
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            self.metrics["errors"] += 1
+            return
+        if isinstance(message, dict) and self.handle_message(message) and self.on_event:
+            self.on_event()
+
+    def handle_message(self, message: dict) -> bool:
+        """Apply one decoded message; returns True when it brought a new strike or rain."""
+        self.metrics["messages"] += 1
+        if WEATHERFLOW_UDP_SERIAL and message.get("serial_number") != WEATHERFLOW_UDP_SERIAL:
+            self.metrics["ignored"] += 1
+            return False
+        message_type = message.get("type")
+        try:
+            with self._lock:
+                if message_type == "obs_st":
+                    notable = False
+                    for row in message.get("obs") or []:
+                        notable = self._apply_observation(row) or notable
+                    self.metrics["observations"] += 1
+                elif message_type == "evt_strike":
+                    epoch, distance_km = message["evt"][:2]
+                    self._strikes.append((epoch, 1, distance_km))
+                    self._strikes_since_obs += 1
+                    self.metrics["strikes"] += 1
+                    notable = True
+                else:
+                    # rapid_wind, hub_status, device_status, evt_precip: nothing to track
+                    self.metrics["ignored"] += 1
+                    return False
+                self._received_at = time.monotonic()
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            self.metrics["errors"] += 1
+            logging.warning("WeatherFlow stream: malformed %s message: %s", message_type, e)
+            return False
+        return notable
+
+    def _apply_observation(self, row: list) -> bool:
+        """Fold one obs_st row into the stream state; returns True if it added rain or strikes."""
+        epoch = row[0]
+        # Rain up to the REST seed's observation is already in the seeded totals.
+        rain_mm = (row[12] or 0.0) if epoch > self._seeded_through else 0.0
+        date_text = datetime.fromtimestamp(epoch).strftime("%Y-%m-%d")
+        if date_text != self._rain_date:
+            self._rain_date = date_text
+            self._rain_day_mm = 0.0
+        self._rain_day_mm += rain_mm
+        if rain_mm:
+            self._rain_minutes.append((epoch, rain_mm))
+
+        # obs_st counts every strike in its interval; only add the ones no evt_strike reported.
+        strike_count = row[15] or 0
+        new_strikes = strike_count > self._strikes_since_obs
+        if new_strikes:
+            self._strikes.append((epoch, strike_count - self._strikes_since_obs, row[14] or 0))
+        self._strikes_since_obs = 0
+
+        temp_c = row[7]
+        fields = {
+            "wind_avg": row[2],
+            "wind_gust": row[3],
+            "wind_direction": row[4],
+            "station_pressure": row[6],
+            "air_temperature": temp_c,
+            "relative_humidity": row[8],
+            "uv": row[10],
+        }
+        # A sensor that failed reports null; leave the field out so readers fall
+        # back to their .get() defaults as they do for a REST observation.
+        self._latest = {"timestamp": epoch, **{key: value for key, value in fields.items() if value is not None}}
+        if temp_c is not None:
+            self._latest["feels_like"] = _compute_feels_like_c(temp_c, row[8], row[2])
+        return bool(rain_mm) or new_strikes
+
+    def is_live(self) -> bool:
+        received_at = self._received_at
+        return (
+            self._latest is not None
+            and received_at is not None
+            and time.monotonic() - received_at <= WEATHERFLOW_STREAM_STALE_SECONDS
+        )
+
+    def observation(self) -> dict | None:
+        """Latest observation in REST shape, or None when the stream has gone quiet."""
+        if not self.is_live():
+            return None
+        with self._lock:
+            # Windows run on station time, so a replayed recording behaves like a live feed.
+            now_epoch = max(self._latest["timestamp"], self._strikes[-1][0] if self._strikes else 0)
+            while self._rain_minutes and self._rain_minutes[0][0] <= now_epoch - 3600:
+                self._rain_minutes.popleft()
+            while self._strikes and self._strikes[0][0] <= now_epoch - 3 * 3600:
+                self._strikes.popleft()
+            last_strike = self._strikes[-1] if self._strikes else None
+            return {
+                **self._latest,
+                "precip_accum_last_1hr": sum(rain_mm for _, rain_mm in self._rain_minutes),
+                "precip_accum_local_day": self._rain_day_mm,
+                "lightning_strike_count_last_3hr": sum(count for _, count, _ in self._strikes),
+                "lightning_strike_last_distance": last_strike[2] if last_strike else 0,
+                "lightning_strike_last_epoch": last_strike[0] if last_strike else None,
+            }
+
+    def summary(self) -> str:
+        state = "live" if self.is_live() else "quiet"
+        return (
+            f"{state}, {self.metrics['messages']} messages, {self.metrics['observations']} observations, "
+            f"{self.metrics['strikes']} strikes, {self.metrics['ignored']} ignored, {self.metrics['errors']} errors"
+        )
+
+
+_storm_event_pending = threading.Event()
+
+
+def _on_weatherflow_event():
+    """Queue one storm follow-up check for new strikes or rain, coalescing bursts of strikes."""
+    if _storm_event_pending.is_set():
+        return
+    _storm_event_pending.set()
+    schedule_job(
+        "storm_event",
+        max(time.time(), _last_storm_follow_up_check_epoch + STORM_FOLLOW_UP_STREAM_INTERVAL),
+    )
+
+
+weatherflow_stream = (
+    WeatherFlowStream(on_event=_on_weatherflow_event)
+    if WEATHERFLOW_INGEST_MODE in {"udp", "replay"}
+    else None
+)
 
 
-def fetch_station_observation():
-    station_id = os.getenv("WEATHERFLOW_STATION_ID")
+def _fetch_rest_observation(station_id: str) -> dict | None:
     api_token = os.getenv("WEATHERFLOW_API_TOKEN")
     url = f"https://swd.weatherflow.com/swd/rest/observations/station/{station_id}?token={api_token}"
     try:
-        response = requests.get(url)
+        response = _http_get("weatherflow", url)
         response.raise_for_status()
         data = response.json()
         return data["obs"][0]
     except requests.RequestException as e:
-        logging.error(f"Error fetching weather data: {e}")
+        logging.error(f"Error fetching weather data for station {station_id}: {e}")
         return None
 
 
-def _maybe_send_rapid_change_alert(temp_f: float):
-    alert_message = check_rapid_changes(temp_f)
-    if alert_message:
-        # post_to_mastodon(alert_message)
-        post_to_bluesky(alert_message)
-        send_telegram_message(alert_message)
-        # post_tweet(alert_message)
+# Callers within this window share one REST fetch; the station reports about once a minute.
+OBSERVATION_CACHE_SECONDS = 60
 
 
-def fetch_current_weather_snapshot():
-    obs = fetch_station_observation()
-    if not obs:
+def fetch_station_observation(station_id: str | None = None):
+    station_id = station_id or PRIMARY_STATION_ID
+    if station_id == PRIMARY_STATION_ID and weatherflow_stream is not None:
+        obs = weatherflow_stream.observation()
+        if obs is not None:
+            return obs
+
+    station = _station_state(station_id)
+    if station.cached_obs is not None and time.monotonic() - station.cached_obs_epoch < OBSERVATION_CACHE_SECONDS:
+        return station.cached_obs
+    obs = _fetch_rest_observation(station_id)
+    if obs is not None:
+        station.cached_obs = obs
+        station.cached_obs_epoch = time.monotonic()
+    return obs
+
+
+_station_fetch_executor = ThreadPoolExecutor(
+    max_workers=max(1, len(_station_states)),
+    thread_name_prefix="station-fetch",
+)
+
+
+def fetch_station_observations() -> dict:
+    """Fetch the latest observation from every configured station concurrently."""
+    station_ids = list(_station_states)
+    if len(station_ids) == 1:
+        return {station_ids[0]: fetch_station_observation(station_ids[0])}
+    return dict(zip(station_ids, _station_fetch_executor.map(fetch_station_observation, station_ids)))
+
+
+def _observation_key(obs: dict) -> tuple | None:
+    """Identify one real observation: the station timestamp, plus the last strike for stream updates."""
+    if obs.get("timestamp") is None:
         return None
+    return obs["timestamp"], obs.get("lightning_strike_last_epoch")
 
-    temp_c = obs.get("air_temperature", 0)
-    temp_f = temp_c * 9 / 5 + 32
-    _maybe_send_rapid_change_alert(temp_f)
-    return _build_weather_snapshot(obs)
+
+def _maybe_send_rapid_change_alert(station: StationState, temp_f: float):
+    alert_message = check_rapid_changes(temp_f, station)
+    if not alert_message:
+        return
+    if station.station_id != PRIMARY_STATION_ID:
+        logging.info("Station %s: rapid temperature drop detected (not posted).", station.station_id)
+        return
+    enqueue_post(alert_message, label="rapid change alert", priority=POST_PRIORITY_HIGH)
+
+
+def fetch_current_weather_snapshot():
+    """Update every station and return the primary station's snapshot (None if it failed)."""
+    primary_snapshot = None
+    for station_id, obs in fetch_station_observations().items():
+        if not obs:
+            continue
+        station = _station_state(station_id)
+        key = _observation_key(obs)
+        if key is not None and key == station.snapshot_key and station.latest_snapshot is not None:
+            # Same observation as last time: reuse the snapshot so its side effects run once.
+            snapshot = station.latest_snapshot
+        else:
+            _append_observation_log(station_id, obs)
+            temp_c = obs.get("air_temperature", 0)
+            temp_f = temp_c * 9 / 5 + 32
+            _maybe_send_rapid_change_alert(station, temp_f)
+            snapshot = _build_weather_snapshot(obs, station)
+            station.snapshot_key = key
+            if station_id != PRIMARY_STATION_ID:
+                logging.info("Station %s: %s.", station_id, _snapshot_log_summary(snapshot))
+        if station_id == PRIMARY_STATION_ID:
+            primary_snapshot = snapshot
+    return primary_snapshot
 
 
 def fetch_weather_data(post_mode: str = "routine", followup_reason: str | None = None):
@@ -2759,31 +4621,12 @@ def fetch_weather_data(post_mode: str = "routine", followup_reason: str | None =
     return format_weather_post(snapshot, post_mode=post_mode, followup_reason=followup_reason)
 
 
-def _build_weather_snapshot(data):
-    global daily_max_wind_avg, daily_max_wind_gust, daily_date
-    global current_event_strike_total, last_strike_epoch_global
-    global current_rain_event_total, rain_event_baseline, last_rain_epoch_global
-    global _latest_weather_snapshot
-
+def _build_weather_snapshot(data, station: StationState | None = None):
+    station = station or _station_state()
     observed_at = datetime.now()
     current_date = observed_at.strftime("%Y-%m-%d")
-    if current_date != daily_date:
-        daily_max_wind_avg = 0.0
-        daily_max_wind_gust = 0.0
-        daily_date = current_date
-        # Reset lightning event info at the start of a new day
-        current_event_strike_total = 0
-        last_strike_epoch_global = None
-        # Reset rain event info at the start of a new day
-        current_rain_event_total = 0.0
-        rain_event_baseline = None
-        last_rain_epoch_global = None
-
-        # Reset daily summary stats at the start of a new day
-        global _daily_high_temp_f, _daily_low_temp_f, _daily_rain_total_in
-        _daily_high_temp_f = None
-        _daily_low_temp_f = None
-        _daily_rain_total_in = 0.0
+    if current_date != station.daily_date:
+        station.reset_daily(current_date)
 
     current_temp_c = data.get('air_temperature', 0)
     current_temp_f = current_temp_c * 9 / 5 + 32
@@ -2796,10 +4639,10 @@ def _build_weather_snapshot(data):
     wind_gust_mps = data.get('wind_gust', 0)
     wind_gust_mph = wind_gust_mps * 2.23694
 
-    if wind_speed_mph > daily_max_wind_avg:
-        daily_max_wind_avg = wind_speed_mph
-    if wind_gust_mph > daily_max_wind_gust:
-        daily_max_wind_gust = wind_gust_mph
+    if wind_speed_mph > station.daily_max_wind_avg:
+        station.daily_max_wind_avg = wind_speed_mph
+    if wind_gust_mph > station.daily_max_wind_gust:
+        station.daily_max_wind_gust = wind_gust_mph
 
     wind_dir_degrees = data.get('wind_direction', 0)
     wind_dir_cardinal = degrees_to_cardinal(wind_dir_degrees)
@@ -2807,7 +4650,7 @@ def _build_weather_snapshot(data):
     humidity = data.get('relative_humidity', 0)
     uv_index = data.get('uv', 0)
     pressure_inhg = _extract_pressure_inhg(data)
-    _update_pressure_history(observed_at, pressure_inhg)
+    _update_pressure_history(station, _station_observation_epoch(data, observed_at.timestamp()), pressure_inhg)
     dew_point_f = _compute_dew_point_f(current_temp_f, humidity)
 
     rain_mm_1h = data.get('precip_accum_last_1hr', 0)
@@ -2816,21 +4659,22 @@ def _build_weather_snapshot(data):
     rain_in_day = rain_mm_day * 0.0393701 if rain_mm_day is not None else 0
 
     # Update daily stats for end-of-day summary
-    _update_daily_stats(current_temp_f, rain_in_day)
+    _update_daily_stats(station, current_temp_f, rain_in_day)
 
     # Rain event tracking:
     now_epoch = time.time()
     if rain_in_day > 0:
-        if (last_rain_epoch_global is None) or ((now_epoch - last_rain_epoch_global) >= 3 * 3600):
-            rain_event_baseline = rain_in_day
-            current_rain_event_total = 0.0
+        if (station.last_rain_epoch is None) or ((now_epoch - station.last_rain_epoch) >= 3 * 3600):
+            station.rain_event_baseline = rain_in_day
+            station.current_rain_event_total = 0.0
         else:
-            current_rain_event_total = rain_in_day - (rain_event_baseline if rain_event_baseline is not None else 0.0)
-        last_rain_epoch_global = now_epoch
+            baseline = station.rain_event_baseline if station.rain_event_baseline is not None else 0.0
+            station.current_rain_event_total = rain_in_day - baseline
+        station.last_rain_epoch = now_epoch
     else:
-        current_rain_event_total = 0.0
-        rain_event_baseline = rain_in_day
-        last_rain_epoch_global = now_epoch
+        station.current_rain_event_total = 0.0
+        station.rain_event_baseline = rain_in_day
+        station.last_rain_epoch = now_epoch
 
     # Retrieve lightning data
     lightning_count = data.get("lightning_strike_count_last_3hr", 0)
@@ -2839,16 +4683,17 @@ def _build_weather_snapshot(data):
     lightning_epoch = data.get("lightning_strike_last_epoch", None)
     if lightning_epoch:
         last_strike_time = _friendly_time(datetime.fromtimestamp(lightning_epoch))
-        if (last_strike_epoch_global is None) or ((lightning_epoch - last_strike_epoch_global) >= 3 * 3600):
-            current_event_strike_total = lightning_count
+        if (station.last_strike_epoch is None) or ((lightning_epoch - station.last_strike_epoch) >= 3 * 3600):
+            station.current_event_strike_total = lightning_count
         else:
-            current_event_strike_total = max(current_event_strike_total, lightning_count)
-        last_strike_epoch_global = lightning_epoch
+            station.current_event_strike_total = max(station.current_event_strike_total, lightning_count)
+        station.last_strike_epoch = lightning_epoch
     else:
         last_strike_time = "N/A"
-        current_event_strike_total = 0
+        station.current_event_strike_total = 0
 
     snapshot = {
+        "station_id": station.station_id,
         "observed_at": observed_at,
         "current_temp_f": current_temp_f,
         "feels_like_f": feels_like_f,
@@ -2861,19 +4706,19 @@ def _build_weather_snapshot(data):
         "dew_point_f": dew_point_f,
         "rain_in_1h": rain_in_1h,
         "rain_in_day": rain_in_day,
-        "current_rain_event_total": current_rain_event_total,
+        "current_rain_event_total": station.current_rain_event_total,
         "lightning_count": lightning_count,
         "lightning_distance_mi": lightning_distance_mi,
         "last_strike_time": last_strike_time,
         "headline_condition": _headline_condition(rain_in_1h, lightning_count),
     }
-    _latest_weather_snapshot = snapshot
+    station.latest_snapshot = snapshot
     return snapshot
 
 
 def format_weather_post(snapshot: dict, post_mode: str = "routine", followup_reason: str | None = None):
     trend_lines = [
-        _temperature_trend_line(snapshot["current_temp_f"]),
+        _temperature_trend_line(snapshot["current_temp_f"], _station_state(snapshot.get("station_id"))),
         _wind_trend_line(snapshot["wind_speed_mph"], snapshot["wind_gust_mph"]),
         _rain_trend_line(snapshot["rain_in_1h"], snapshot["current_rain_event_total"]),
         _lightning_trend_line(snapshot["lightning_count"], snapshot["lightning_distance_mi"]),
@@ -2963,29 +4808,56 @@ def format_weather_post(snapshot: dict, post_mode: str = "routine", followup_rea
     return "\n".join(lines)
 
 
-def format_weather_data(data, post_mode: str = "routine", followup_reason: str | None = None):
-    snapshot = _build_weather_snapshot(data)
+def format_weather_data(
+    data,
+    post_mode: str = "routine",
+    followup_reason: str | None = None,
+    station: StationState | None = None,
+):
+    snapshot = _build_weather_snapshot(data, station)
     return format_weather_post(snapshot, post_mode=post_mode, followup_reason=followup_reason)
 
 
-def post_weather_update(weather_message: str, snapshot: dict, post_mode: str):
+def _weather_post_priority(post_mode: str, followup_reason: str | None = None) -> int:
+    if post_mode == "storm_followup":
+        return POST_PRIORITY_URGENT if _storm_follow_up_is_urgent(followup_reason or "") else POST_PRIORITY_HIGH
+    if post_mode == "force":
+        return POST_PRIORITY_NORMAL
+    return POST_PRIORITY_LOW
+
+
+def post_weather_update(
+    weather_message: str,
+    snapshot: dict,
+    post_mode: str,
+    followup_reason: str | None = None,
+):
     logging.info("Sending %s weather post (%s).", post_mode, _snapshot_log_summary(snapshot))
-    # post_to_mastodon(weather_message)
-    post_to_bluesky(weather_message)
-    send_telegram_message(weather_message)
-    # post_tweet(weather_message)
+    enqueue_post(
+        weather_message,
+        label=f"{post_mode} weather",
+        priority=_weather_post_priority(post_mode, followup_reason),
+    )
     _record_weather_post(snapshot, post_mode)
 
 
+def _storm_follow_up_interval() -> int:
+    streaming = weatherflow_stream is not None and weatherflow_stream.is_live()
+    return STORM_FOLLOW_UP_STREAM_INTERVAL if streaming else STORM_FOLLOW_UP_CHECK_INTERVAL
+
+
 def check_storm_follow_up():
     global _last_storm_follow_up_check_epoch, _last_storm_follow_up_epoch
 
-    monitor_snapshot = _latest_weather_snapshot or _last_posted_weather_snapshot
-    if not _storm_monitor_active(monitor_snapshot):
+    # With a live stream the next observation is already in memory, so skip the
+    # monitor gate and let _storm_follow_up_reason judge each new strike or report.
+    streaming = weatherflow_stream is not None and weatherflow_stream.is_live()
+    monitor_snapshot = _station_state().latest_snapshot or _last_posted_weather_snapshot
+    if not streaming and not _storm_monitor_active(monitor_snapshot):
         return
 
     now_epoch = time.time()
-    if (now_epoch - _last_storm_follow_up_check_epoch) < STORM_FOLLOW_UP_CHECK_INTERVAL:
+    if (now_epoch - _last_storm_follow_up_check_epoch) < _storm_follow_up_interval():
         return
     _last_storm_follow_up_check_epoch = now_epoch
 
@@ -3005,7 +4877,7 @@ def check_storm_follow_up():
         return
 
     weather_message = format_weather_post(snapshot, post_mode="storm_followup", followup_reason=reason)
-    post_weather_update(weather_message, snapshot, "storm_followup")
+    post_weather_update(weather_message, snapshot, "storm_followup", followup_reason=reason)
     _last_storm_follow_up_epoch = time.time()
 
 
@@ -3134,7 +5006,8 @@ def post_to_bluesky(weather_message):
             len(post_message),
         )
     try:
-        post_text(session, post_message)
+        with _bluesky_lock:
+            post_text(session, post_message)
         logging.info("Bluesky: Weather data posted.")
         return True
     except Exception as e:
@@ -3162,15 +5035,236 @@ def post_tweet(weather_message):
         return False
 
 
+# Outbound posting pipeline: checks enqueue rendered posts and return immediately,
+# while one background worker per platform delivers them, most urgent first, with
+# retry/backoff. A platform that is backing off only delays its own queue.
+POST_PRIORITY_URGENT = 0  # NWS warnings, lightning within 5 miles, local tornado reports
+POST_PRIORITY_HIGH = 1
+POST_PRIORITY_NORMAL = 2
+POST_PRIORITY_LOW = 3  # routine, sunrise/sunset, AFD, daily summary
+OUTBOUND_QUEUE_MAXSIZE = 200
+OUTBOUND_MAX_ATTEMPTS = 3
+OUTBOUND_RETRY_BACKOFF_SECONDS = 5
+MASTODON_POSTING_ENABLED = os.getenv("WEATHERBOT_ENABLE_MASTODON", "").strip().lower() in {"1", "true", "yes"}
+TWITTER_POSTING_ENABLED = os.getenv("WEATHERBOT_ENABLE_TWITTER", "").strip().lower() in {"1", "true", "yes"}
+
+
+class OutboundQueue(queue.PriorityQueue):
+    """PriorityQueue that, when full, makes room for a more urgent post."""
+
+    def put_displacing(self, item):
+        """Put item without blocking; returns the entry it evicted, or None.
+
+        When full, the least urgent (and newest) queued entry is replaced if
+        item outranks it; otherwise queue.Full is raised.
+        """
+        with self.mutex:
+            if self.maxsize <= 0 or self._qsize() < self.maxsize:
+                self._put(item)
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+                return None
+            index = max(range(len(self.queue)), key=self.queue.__getitem__)
+            evicted = self.queue[index]
+            if item[:2] >= evicted[:2]:
+                raise queue.Full
+            # The replacement takes over the evicted entry's unfinished task.
+            self.queue[index] = item
+            heapq.heapify(self.queue)
+            return evicted
+
+
+_outbound_sequence = itertools.count()
+_platform_queues = {}
+_platform_workers = {}
+_outbound_worker_lock = threading.Lock()
+
+
+def _deliver_to_bluesky(post: dict) -> bool:
+    if post.get("image_url"):
+        return post_to_bluesky_with_official_image(post["message"], post["image_url"], post.get("alt_text") or "")
+    return post_to_bluesky(post["message"])
+
+
+def _deliver_to_telegram(post: dict) -> bool:
+    if post.get("image_url"):
+        return send_telegram_photo(post["message"], post["image_url"])
+    return send_telegram_message(post["message"])
+
+
+def _deliver_to_mastodon(post: dict) -> bool:
+    return post_to_mastodon(post["message"])
+
+
+def _deliver_to_twitter(post: dict) -> bool:
+    return post_tweet(post["message"])
+
+
+def _outbound_platforms() -> list:
+    platforms = []
+    if session is not None:
+        platforms.append(("bluesky", _deliver_to_bluesky))
+    if TELEGRAM_TOKEN and TELEGRAM_CHAT_ID:
+        platforms.append(("telegram", _deliver_to_telegram))
+    if MASTODON_POSTING_ENABLED:
+        platforms.append(("mastodon", _deliver_to_mastodon))
+    if TWITTER_POSTING_ENABLED:
+        platforms.append(("twitter", _deliver_to_twitter))
+    return platforms
+
+
+def _deliver_with_retry(platform: str, deliver, post: dict) -> dict:
+    started = time.monotonic()
+    for attempt in range(1, OUTBOUND_MAX_ATTEMPTS + 1):
+        try:
+            delivered = deliver(post)
+        except TelegramSendUnconfirmed as e:
+            # Retrying could post the same message twice.
+            logging.warning("Outbound %s: %s outcome unknown (%s); not retrying.", post["label"], platform, e)
+            return {"ok": False, "unconfirmed": True, "attempts": attempt, "latency": time.monotonic() - started}
+        if delivered:
+            return {"ok": True, "attempts": attempt, "latency": time.monotonic() - started}
+        if attempt < OUTBOUND_MAX_ATTEMPTS:
+            delay = OUTBOUND_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1))
+            logging.warning(
+                "Outbound %s: %s delivery failed (attempt %s/%s); retrying in %ss.",
+                post["label"],
+                platform,
+                attempt,
+                OUTBOUND_MAX_ATTEMPTS,
+                delay,
+            )
+            time.sleep(delay)
+    logging.error("Outbound %s: giving up on %s after %s attempts.", post["label"], platform, OUTBOUND_MAX_ATTEMPTS)
+    return {"ok": False, "attempts": OUTBOUND_MAX_ATTEMPTS, "latency": time.monotonic() - started}
+
+
+def _delivery_summary(results: dict) -> str:
+    if not results:
+        return "no platforms enabled"
+    return ", ".join(
+        f"{platform} {'ok' if record['ok'] else 'unconfirmed' if record.get('unconfirmed') else 'failed'}"
+        f" in {record['latency']:.1f}s"
+        f" ({record['attempts']} attempt{'s' if record['attempts'] != 1 else ''})"
+        for platform, record in results.items()
+    )
+
+
+def _run_platform_worker(platform: str, deliver, outbound: OutboundQueue):
+    while True:
+        _, _, post = outbound.get()
+        try:
+            waited = time.monotonic() - post["enqueued_at"]
+            record = _deliver_with_retry(platform, deliver, post)
+            logging.info(
+                "Outbound %s: %s (queued %.1fs).",
+                post["label"],
+                _delivery_summary({platform: record}),
+                waited,
+            )
+        except Exception:
+            logging.exception("Outbound %s: %s delivery crashed.", post.get("label", "post"), platform)
+        finally:
+            outbound.task_done()
+
+
+def _platform_queue(platform: str, deliver) -> OutboundQueue:
+    """Return the platform's outbound queue, starting its worker if needed."""
+    with _outbound_worker_lock:
+        outbound = _platform_queues.get(platform)
+        if outbound is None:
+            outbound = _platform_queues[platform] = OutboundQueue(maxsize=OUTBOUND_QUEUE_MAXSIZE)
+        worker = _platform_workers.get(platform)
+        if worker is None or not worker.is_alive():
+            worker = threading.Thread(
+                target=_run_platform_worker,
+                args=(platform, deliver, outbound),
+                name=f"outbound-{platform}",
+                daemon=True,
+            )
+            _platform_workers[platform] = worker
+            worker.start()
+        return outbound
+
+
+def _outbound_pending() -> int:
+    with _outbound_worker_lock:
+        queues = list(_platform_queues.values())
+    return sum(outbound.unfinished_tasks for outbound in queues)
+
+
+def enqueue_post(
+    message: str,
+    image_url: str | None = None,
+    alt_text: str | None = None,
+    label: str = "post",
+    priority: int = POST_PRIORITY_NORMAL,
+) -> bool:
+    """Queue a rendered post for every enabled platform without waiting on social APIs.
+
+    Lower priority values are delivered first; posts with equal priority keep
+    their enqueue order. When the queue is full, the least urgent queued post
+    is dropped to make room for a more urgent one. Each platform has its own
+    queue, so this returns True if at least one platform accepted the post.
+    """
+    post = {
+        "message": message,
+        "image_url": image_url,
+        "alt_text": alt_text,
+        "label": label,
+        "priority": priority,
+        "enqueued_at": time.monotonic(),
+    }
+    platforms = _outbound_platforms()
+    if not platforms:
+        logging.info("Outbound %s: no platforms enabled.", label)
+        return False
+    entry = (priority, next(_outbound_sequence), post)
+    queued = False
+    for platform, deliver in platforms:
+        try:
+            evicted = _platform_queue(platform, deliver).put_displacing(entry)
+        except queue.Full:
+            logging.error(
+                "Outbound %s queue is full (%s pending); dropping %s post.",
+                platform,
+                OUTBOUND_QUEUE_MAXSIZE,
+                label,
+            )
+            continue
+        queued = True
+        if evicted is not None:
+            logging.error(
+                "Outbound %s queue is full (%s pending); dropped queued %s post for %s.",
+                platform,
+                OUTBOUND_QUEUE_MAXSIZE,
+                evicted[2]["label"],
+                label,
+            )
+    return queued
+
+
+def flush_outbound_posts(timeout: float = 30.0) -> bool:
+    """Wait up to timeout seconds for queued posts to finish delivering."""
+    deadline = time.monotonic() + timeout
+    while pending := _outbound_pending():
+        if time.monotonic() >= deadline:
+            logging.warning("Outbound queues still have %s undelivered posts.", pending)
+            return False
+        time.sleep(0.2)
+    return True
+
+
 # Heartbeat function to signal the bot is active
 def send_heartbeat():
+    _log_http_stats()
     url = os.getenv("BETTERSTACK_HEARTBEAT_URL")
     if not url:
         logging.warning("Heartbeat URL is not configured. Skipping heartbeat.")
         return
 
     try:
-        requests.get(url).raise_for_status()
+        _http_get("heartbeat", url).raise_for_status()
         logging.info("Heartbeat sent successfully for %s.", _friendly_time())
     except requests.RequestException as e:
         logging.error(f"Heartbeat: Sending failed. Error: {e}")
@@ -3187,9 +5281,13 @@ def send_heartbeat():
 #
 #     ps aux | grep main.py
 #
-# This will trigger the force_update() function.
+# This will trigger the force_update() function, which queues run_force_update_job().
 def force_update(signum, frame):
-    logging.info("Force update signal received.")
+    _request_from_signal("force_update")
+
+
+def run_force_update_job():
+    logging.info("Force update requested.")
     snapshot = fetch_current_weather_snapshot()
     if snapshot:
         weather_message = format_weather_post(snapshot, post_mode="routine")
@@ -3218,36 +5316,37 @@ def _load_control_command() -> str | None:
 
 def _run_control_command(command: str):
     if command in {"weather", "routine", "force"}:
-        force_update(None, None)
+        run_force_update_job()
     elif command in {"alerts", "nws"}:
-        check_nws_alerts(force=True)
+        _run_forced_source_check("alerts")
     elif command == "spc":
-        check_spc_outlooks(force=True)
+        _run_forced_source_check("spc")
     elif command in {"earthquake", "earthquakes", "usgs"}:
-        check_usgs_earthquakes(force=True)
+        _run_forced_source_check("earthquakes")
     elif command in {"products", "forecast_products", "afd_hwo_lsr"}:
-        check_forecast_products(force=True)
+        _run_forced_source_check("products")
     elif command in {"river", "flood"}:
-        check_river_flood_status(force=True)
+        _run_forced_source_check("river")
     elif command in {"summary", "daily_summary"}:
         send_daily_summary()
     elif command == "heartbeat":
         send_heartbeat()
     elif command in {"all", "all_checks"}:
-        check_nws_alerts(force=True)
-        check_spc_outlooks(force=True)
-        check_usgs_earthquakes(force=True)
-        check_forecast_products(force=True)
-        check_river_flood_status(force=True)
+        for name in SOURCE_CHECK_DEADLINES:
+            _run_forced_source_check(name)
         send_heartbeat()
     else:
         logging.warning("Unknown control command requested: %s", command)
         return
 
-    logging.info("Control command completed: %s", command)
+    logging.info("Control command dispatched: %s", command)
 
 
 def run_control_command(signum, frame):
+    _request_from_signal("control_command")
+
+
+def run_control_command_job():
     command = _load_control_command()
     if not command:
         return
@@ -3256,76 +5355,365 @@ def run_control_command(signum, frame):
     _run_control_command(command)
 
 
+def handle_shutdown(signum, frame):
+    _request_from_signal("shutdown")
+
+
+SOURCE_CHECK_MODE = os.getenv("WEATHERBOT_SOURCE_CHECK_MODE", "concurrent").strip().lower()
+# Seconds a source check may run before it is logged as overdue.
+SOURCE_CHECK_DEADLINES = {
+    "alerts": 45,
+    "spc": 90,
+    "earthquakes": 45,
+    "products": 120,
+    "river": 60,
+}
+_source_check_executor = ThreadPoolExecutor(
+    max_workers=len(SOURCE_CHECK_DEADLINES),
+    thread_name_prefix="source-check",
+)
+# One lock per source check, so a forced run from a control command waits for
+# a scheduled run of the same check instead of overlapping it.
+_source_check_locks = {name: threading.Lock() for name in SOURCE_CHECK_DEADLINES}
+_scheduler_heap = []
+_scheduler_sequence = itertools.count()
+_scheduler_lock = threading.Lock()
+# Self-pipe the scheduler sleeps on; any thread (or a signal handler) writes a
+# byte to wake it.
+_scheduler_wake_read, _scheduler_wake_write = os.pipe()
+os.set_blocking(_scheduler_wake_read, False)
+os.set_blocking(_scheduler_wake_write, False)
+# Signal handlers run on the main thread, which is the scheduler thread and may
+# be holding any lock when interrupted. They only append the request name here
+# (deque.append takes no Python lock) and write to the pipe; scheduler() runs it.
+_signal_requests = deque()
+
+
+def _wake_scheduler():
+    try:
+        os.write(_scheduler_wake_write, b"\0")
+    except BlockingIOError:
+        pass  # The pipe is full, so a wakeup is already pending.
+
+
+def _drain_scheduler_wakeups():
+    try:
+        while os.read(_scheduler_wake_read, 4096):
+            pass
+    except BlockingIOError:
+        pass
+
+
+def _request_from_signal(name: str):
+    _signal_requests.append(name)
+    _wake_scheduler()
+
+
+def _run_timed_source_check(name: str, check):
+    with _source_check_locks[name]:
+        started = time.monotonic()
+        try:
+            check()
+        finally:
+            flush_state_tables()
+        elapsed = time.monotonic() - started
+    if elapsed > SOURCE_CHECK_DEADLINES.get(name, 60):
+        logging.warning("Source check %s finished late after %.1fs.", name, elapsed)
+
+
+def _run_forced_source_check(name: str):
+    """Run a source check with force=True on the pool, serialized with its scheduled runs."""
+    check = lambda: SCHEDULED_JOBS[name]["run"](force=True)
+    if SOURCE_CHECK_MODE != "concurrent":
+        _run_timed_source_check(name, check)
+        return
+
+    def _on_done(done_future):
+        if done_future.exception() is not None:
+            logging.error("Forced source check %s failed: %s", name, done_future.exception())
+
+    _source_check_executor.submit(_run_timed_source_check, name, check).add_done_callback(_on_done)
+
+
+def _interval_due(last_epoch: float, interval: int, now_epoch: float) -> float:
+    """Next run for an interval job: one interval after its last real check.
+
+    If the check returned on a guard without recording a run, try again one
+    full interval from now instead of spinning.
+    """
+    due = last_epoch + interval
+    return due if due > now_epoch else now_epoch + interval
+
+
+def _next_wall_clock_epoch(now_epoch: float, minutes: tuple, hours: tuple | None = None) -> float:
+    # Step in UTC epoch minutes and convert each one to local time only for the
+    # match, so the repeated hour at fall-back and the skipped one in spring are
+    # both handled. At most a day (plus a DST hour) of candidates.
+    candidate = (int(now_epoch) // 60 + 1) * 60
+    for _ in range(25 * 60 + 1):
+        local = datetime.fromtimestamp(candidate, PEORIA_TIMEZONE)
+        if local.minute in minutes and (hours is None or local.hour in hours):
+            return float(candidate)
+        candidate += 60
+    return now_epoch + 60
+
+
+def _solar_notice_due(now_epoch: float, event_name: str, lead_minutes: int, last_notice_date: str | None) -> float:
+    now = datetime.fromtimestamp(now_epoch, PEORIA_TIMEZONE)
+    for day_offset in range(3):
+        day = now + timedelta(days=day_offset)
+        if day_offset == 0 and last_notice_date == day.strftime("%Y-%m-%d"):
+            continue
+        event_time = _sun_times(day)[event_name]
+        if event_time <= now:
+            continue
+        notice_epoch = (event_time - timedelta(minutes=lead_minutes)).timestamp()
+        # Inside the notice window already (e.g. after a restart or a failed fetch): retry each minute.
+        return max(notice_epoch, now_epoch + (60 if notice_epoch <= now_epoch else 0))
+    return now_epoch + 3600
+
+
+def run_storm_follow_up_job():
+    check_storm_follow_up()
+
+
+def run_storm_event_job():
+    # A routine post since the event was queued moves the follow-up interval on;
+    # keep the event pending until then rather than dropping it on the guard.
+    due_epoch = _last_storm_follow_up_check_epoch + _storm_follow_up_interval()
+    if due_epoch > time.time():
+        schedule_job("storm_event", due_epoch)
+        return
+    _storm_event_pending.clear()
+    run_storm_follow_up_job()
+
+
+def run_routine_cycle():
+    global _last_storm_follow_up_check_epoch
+    now = datetime.now(PEORIA_TIMEZONE)
+    logging.info("Routine cycle %s: checking current conditions.", _friendly_time(now))
+    snapshot = fetch_current_weather_snapshot()
+    if not snapshot:
+        logging.warning("Routine cycle %s: could not fetch a weather snapshot.", _friendly_time(now))
+        return
+
+    # A storm follow-up posted in the same slot already covers this quarter hour.
+    if _last_storm_follow_up_epoch and time.time() - _last_storm_follow_up_epoch < 60:
+        logging.info("Routine cycle %s: covered by a storm follow-up.", _friendly_time(now))
+        return
+
+    quiet_mode = _is_quiet_hours(now) and not _is_notable_weather(snapshot)
+    if _should_suppress_routine_post(snapshot, quiet_mode):
+        logging.info(
+            "Routine cycle %s: suppressed (%s).",
+            _friendly_time(now),
+            _routine_suppression_reason(snapshot, quiet_mode),
+        )
+        # Nothing posted, so the quarter-hour storm check still has to happen.
+        check_storm_follow_up()
+        return
+
+    post_mode = "quiet" if quiet_mode else "routine"
+    logging.info(
+        "Routine cycle %s: posting mode=%s (%s).",
+        _friendly_time(now),
+        post_mode,
+        _snapshot_log_summary(snapshot),
+    )
+    weather_message = format_weather_post(snapshot, post_mode=post_mode)
+    post_weather_update(weather_message, snapshot, post_mode)
+    # The routine post reports storm conditions too; the follow-up job's next
+    # check counts its interval from here instead of posting right after it.
+    _last_storm_follow_up_check_epoch = time.time()
+
+
+def run_daily_summary_job():
+    global _last_daily_summary_date
+    today = datetime.now(PEORIA_TIMEZONE).strftime("%Y-%m-%d")
+    if _last_daily_summary_date != today:
+        send_daily_summary()
+        _last_daily_summary_date = today
+
+
+# Each job names how it runs and how to compute its next due time (epoch seconds).
+# Source checks run on the source-check pool; everything else runs on the scheduler thread.
+SCHEDULED_JOBS = {
+    "alerts": {
+        "run": check_nws_alerts,
+        "source_check": True,
+        "next_due": lambda now_epoch: _interval_due(_last_nws_alert_check_epoch, NWS_ALERT_CHECK_INTERVAL, now_epoch),
+    },
+    "spc": {
+        "run": check_spc_outlooks,
+        "source_check": True,
+        "next_due": lambda now_epoch: _interval_due(_last_spc_check_epoch, SPC_CHECK_INTERVAL, now_epoch),
+    },
+    "earthquakes": {
+        "run": check_usgs_earthquakes,
+        "source_check": True,
+        "next_due": lambda now_epoch: _interval_due(
+            _last_earthquake_check_epoch, EARTHQUAKE_CHECK_INTERVAL, now_epoch
+        ),
+    },
+    "products": {
+        "run": check_forecast_products,
+        "source_check": True,
+        "next_due": lambda now_epoch: _interval_due(
+            _last_forecast_product_check_epoch, FORECAST_PRODUCT_CHECK_INTERVAL, now_epoch
+        ),
+    },
+    "river": {
+        "run": check_river_flood_status,
+        "source_check": True,
+        "next_due": lambda now_epoch: _interval_due(_last_river_check_epoch, RIVER_CHECK_INTERVAL, now_epoch),
+    },
+    "storm_follow_up": {
+        "run": run_storm_follow_up_job,
+        "next_due": lambda now_epoch: _interval_due(
+            _last_storm_follow_up_check_epoch, STORM_FOLLOW_UP_CHECK_INTERVAL, now_epoch
+        ),
+    },
+    # One-shot jobs queued by the SIGUSR1/SIGUSR2 handlers.
+    "force_update": {
+        "run": run_force_update_job,
+        "next_due": lambda now_epoch: None,
+    },
+    "control_command": {
+        "run": run_control_command_job,
+        "next_due": lambda now_epoch: None,
+    },
+    # One-shot: queued by the WeatherFlow stream when a message brings a new strike or rain.
+    "storm_event": {
+        "run": run_storm_event_job,
+        "next_due": lambda now_epoch: None,
+    },
+    "routine": {
+        "run": run_routine_cycle,
+        "next_due": lambda now_epoch: _next_wall_clock_epoch(now_epoch, (0, 15, 30, 45)),
+    },
+    "heartbeat": {
+        "run": send_heartbeat,
+        "next_due": lambda now_epoch: _next_wall_clock_epoch(now_epoch, (0, 30)),
+    },
+    "daily_summary": {
+        "run": run_daily_summary_job,
+        "next_due": lambda now_epoch: _next_wall_clock_epoch(now_epoch, (59,), hours=(23,)),
+    },
+    "sunrise_notice": {
+        "run": check_sunrise_notice,
+        "next_due": lambda now_epoch: _solar_notice_due(
+            now_epoch, "sunrise", SUNRISE_NOTICE_MINUTES, _last_sunrise_notice_date
+        ),
+    },
+    "sunset_notice": {
+        "run": check_sunset_notice,
+        "next_due": lambda now_epoch: _solar_notice_due(
+            now_epoch, "sunset", SUNSET_NOTICE_MINUTES, _last_sunset_notice_date
+        ),
+    },
+}
+
+
+def schedule_job(name: str, due_epoch: float):
+    with _scheduler_lock:
+        heapq.heappush(_scheduler_heap, (due_epoch, next(_scheduler_sequence), name))
+    _wake_scheduler()
+
+
+def _reschedule_job(name: str):
+    due_epoch = SCHEDULED_JOBS[name]["next_due"](time.time())
+    if due_epoch is not None:
+        schedule_job(name, due_epoch)
+
+
+def _run_scheduled_job(name: str):
+    job = SCHEDULED_JOBS[name]
+    if job.get("source_check") and SOURCE_CHECK_MODE == "concurrent":
+        future = _source_check_executor.submit(_run_timed_source_check, name, job["run"])
+
+        def _on_done(done_future):
+            if done_future.exception() is not None:
+                logging.error("Source check %s failed: %s", name, done_future.exception())
+            _reschedule_job(name)
+
+        future.add_done_callback(_on_done)
+        return
+
+    try:
+        if job.get("source_check"):
+            _run_timed_source_check(name, job["run"])
+        else:
+            job["run"]()
+    except Exception:
+        logging.exception("Scheduled job %s failed.", name)
+    flush_state_tables()
+    _reschedule_job(name)
+
+
 # Register the signal handlers for manual control.
 signal.signal(signal.SIGUSR1, force_update)
 signal.signal(signal.SIGUSR2, run_control_command)
+signal.signal(signal.SIGTERM, handle_shutdown)
 _load_post_state()
+replay_observation_log()
+if SOLAR_PRECOMPUTE_YEAR:
+    precompute_sun_times(datetime.now(PEORIA_TIMEZONE).year)
 
 
-# Scheduler function that runs the weather bot at defined intervals
+# Scheduler: a timer heap of jobs, sleeping exactly until the next one is due or
+# until schedule_job() or a signal handler wakes it.
 def scheduler():
+    now_epoch = time.time()
+    for name in SCHEDULED_JOBS:
+        # Interval checks start immediately; wall-clock jobs wait for their slot.
+        first_due = SCHEDULED_JOBS[name]["next_due"](now_epoch)
+        if SCHEDULED_JOBS[name].get("source_check"):
+            first_due = now_epoch
+        if first_due is not None:
+            schedule_job(name, first_due)
+
+    shutting_down = False
     while True:
-        now = datetime.now(PEORIA_TIMEZONE)
-        minute = now.minute
-        hour = now.hour
-        today = now.strftime("%Y-%m-%d")
-
-        check_nws_alerts()
-        check_spc_outlooks()
-        check_usgs_earthquakes()
-        check_forecast_products()
-        check_river_flood_status()
-        check_sunrise_notice(now)
-        check_sunset_notice(now)
-        if minute % 15 != 0:
-            check_storm_follow_up()
-
-        # Daily summary at 23:59 (once per day)
-        global _last_daily_summary_date
-        if hour == 23 and minute == 59 and _last_daily_summary_date != today:
-            send_daily_summary()
-            _last_daily_summary_date = today
-            # Sleep briefly to avoid double-send within the same minute
-            time.sleep(61)
-            continue
-
-        # At every 15-minute mark, fetch and post weather data
-        if minute % 15 == 0:
-            logging.info("Routine cycle %s: checking current conditions.", _friendly_time(now))
-            snapshot = fetch_current_weather_snapshot()
-            if snapshot:
-                quiet_mode = _is_quiet_hours(now) and not _is_notable_weather(snapshot)
-                if _should_suppress_routine_post(snapshot, quiet_mode):
-                    logging.info(
-                        "Routine cycle %s: suppressed (%s).",
-                        _friendly_time(now),
-                        _routine_suppression_reason(snapshot, quiet_mode),
-                    )
-                else:
-                    post_mode = "quiet" if quiet_mode else "routine"
-                    logging.info(
-                        "Routine cycle %s: posting mode=%s (%s).",
-                        _friendly_time(now),
-                        post_mode,
-                        _snapshot_log_summary(snapshot),
-                    )
-                    weather_message = format_weather_post(snapshot, post_mode=post_mode)
-                    post_weather_update(weather_message, snapshot, post_mode)
+        _drain_scheduler_wakeups()
+        while _signal_requests:
+            request = _signal_requests.popleft()
+            if request == "shutdown":
+                shutting_down = True
             else:
-                logging.warning("Routine cycle %s: could not fetch a weather snapshot.", _friendly_time(now))
+                schedule_job(request, time.time())
+        if shutting_down:
+            break
+        with _scheduler_lock:
+            due_epoch, _, name = _scheduler_heap[0] if _scheduler_heap else (None, None, None)
+            if due_epoch is not None and due_epoch <= time.time():
+                heapq.heappop(_scheduler_heap)
+            else:
+                name = None
+
+        if name is None:
+            timeout = None if due_epoch is None else max(0.0, due_epoch - time.time())
+            select.select([_scheduler_wake_read], [], [], timeout)
+            continue
 
-        # Send a heartbeat every 30 minutes
-        if minute % 30 == 0:
-            send_heartbeat()
+        lateness = time.time() - due_epoch
+        if lateness > 5:
+            logging.warning("Scheduled job %s started %.1fs late.", name, lateness)
+        _run_scheduled_job(name)
 
-        # Sleep until the start of the next minute
-        time.sleep(60 - datetime.now().second)
+    logging.info("Shutdown signal received; flushing outbound posts and state.")
+    _source_check_executor.shutdown(wait=True, cancel_futures=True)
+    flush_outbound_posts()
+    flush_state_tables()
 
 
 # Main execution block
 if __name__ == "__main__":
     try:
         logging.info("Weather bot starting.")
+        if weatherflow_stream is not None:
+            weatherflow_stream.start(WEATHERFLOW_INGEST_MODE)
         scheduler()
     except KeyboardInterrupt:
         logging.info("Weather bot stopped manually.")
+        flush_outbound_posts()
+        flush_state_tables()